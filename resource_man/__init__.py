@@ -1,3 +1,5 @@
+import importlib
+
 from .__meta__ import version as __version__
 
 from .importlib_interface import \
@@ -5,9 +7,40 @@ from .importlib_interface import \
     rsc_files, rsc_as_file, rsc_read_binary, rsc_read_text, rsc_contents, rsc_is_resource
 
 from .interface import \
-    ResourceNotAvailable, Resource, ResourceManagerInterface, ResourceManager, \
+    ResourceNotAvailable, Resource, ResourceManagerInterface, ResourceManager, MountedResources, \
     get_global_manager, set_global_manager, temp_manager, add_manager, remove_manager, \
     clear, register_resource, register, register_data, register_directory, unregister, has_resource, \
-    get_resources, get_resource, get_binary, get_text, registered_datas, \
+    get_resources, get_resource, get_binary, get_text, preload, registered_datas, \
+    create_rman, mount, unmount, RMAN_FILENAME, \
     MISSING
 
+
+# Optional helpers that are imported on first access, so "import resource_man" does not import PyInstaller or Qt.
+LAZY_SUBMODULES = ('pyinstaller', 'qt')
+LAZY_ATTRS = {
+    'find_datas': 'pyinstaller', 'create_resource_table': 'pyinstaller',
+    'EXCLUDE_EXT': 'pyinstaller', 'SOURCE_SUFFIXES': 'pyinstaller',
+
+    'QFile': 'qt', 'QPixmap': 'qt', 'QIcon': 'qt', 'QSvgWidget': 'qt',
+    'create_qrc': 'qt', 'compile_qrc': 'qt', 'create_compiled': 'qt', 'load_resource': 'qt',
+    'compiled_py_to_qtpy': 'qt', 'clear_icon_cache': 'qt', 'get_cached_icon': 'qt', 'get_cached_pixmap': 'qt',
+    }
+
+
+def __getattr__(name):
+    """Import the optional submodules and their helpers on first access (PEP 562)."""
+    if name in LAZY_SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+
+    try:
+        module = LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name)) from None
+
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(LAZY_SUBMODULES) | set(LAZY_ATTRS))
@@ -1,6 +1,6 @@
 import os
 import sys
-import contextlib
+import functools
 import inspect
 from pathlib import Path
 
@@ -43,7 +43,7 @@ except (ImportError, Exception):
 
 
 __all__ = [
-    'READ_API', 'FILES_API', 'EXE_PATH',
+    'READ_API', 'FILES_API', 'EXE_PATH', 'exe_path_join',
     'Traversable', 'contents', 'is_resource', 'read_binary', 'read_text', 'files', 'as_file',
     'rsc_files', 'rsc_as_file', 'rsc_read_binary', 'rsc_read_text', 'rsc_contents', 'rsc_is_resource'
     ]
@@ -51,6 +51,13 @@ __all__ = [
 
 EXE_PATH = getattr(sys, '_MEIPASS', os.path.dirname(sys.executable))
 
+
+@functools.lru_cache(maxsize=1024)
+def exe_path_join(exe_path, path):
+    """Return the path joined to the executable path. Call with EXE_PATH, so a changed EXE_PATH is a new key."""
+    return os.path.join(exe_path, path)
+
+
 if not hasattr(Traversable, 'read_bytes'):
     def path_read_bytes(self):
         with open(str(self), 'rb') as f:
@@ -66,14 +73,33 @@ if not hasattr(Traversable, 'read_text'):
     Traversable.read_text = path_read_text
 
 
+RSC_FILES_CACHE = {}
+
+
+def module_path(module):
+    """Return the directory of a package or the file of a module without inspect.getfile."""
+    path = getattr(module, '__path__', None)
+    if path:
+        return Path(next(iter(path)))
+    return Path(module.__file__)
+
+
 def rsc_files(module):
     if isinstance(module, str):
+        # Check the cached module path. The path changes if the executable state changes.
+        key = (module, getattr(sys, 'frozen', False), EXE_PATH)
+        try:
+            return RSC_FILES_CACHE[key]
+        except KeyError:
+            pass
+
         # Check for the executable path
         if getattr(sys, 'frozen', False):
             path = Path(EXE_PATH) / module.replace('.', '/')
             if path.with_suffix('').name == '__init__':
                 path = path.parent
             if path.exists():
+                RSC_FILES_CACHE[key] = path
                 return path
 
         # Find the module path from the imported module
@@ -84,42 +110,67 @@ def rsc_files(module):
             toplvl, remain = module, ''
 
         # Get or import the module
+        found = True
         try:
             module = sys.modules[toplvl]
-            path = Path(inspect.getfile(module))
+            path = module_path(module)
         except (KeyError, Exception):
             try:
                 module = __import__(toplvl)
-                path = Path(inspect.getfile(module))
+                path = module_path(module)
             except (ImportError, Exception):
                 module = toplvl
                 path = Path(module)
+                found = False  # Do not cache. The module may be importable later.
 
         # Get the path of the module
         if path.with_suffix('').name == '__init__':
             path = path.parent
 
         # Find the path from the top level module
-        for pkg in remain.split('.'):
-            path = path.joinpath(pkg)
-    else:
+        if remain:
+            path = path.joinpath(*remain.split('.'))
+
+        if path.with_suffix('').name == '__init__':
+            path = path.parent
+        if found:
+            RSC_FILES_CACHE[key] = path
+        return path
+
+    try:
+        path = module_path(module)
+    except (AttributeError, TypeError, Exception):
         path = Path(inspect.getfile(module))
     if path.with_suffix('').name == '__init__':
         path = path.parent
     return path
 
 
-@contextlib.contextmanager
+class FileContext(object):
+    """Context manager that returns a file path that already exists. Nothing is cleaned up on exit."""
+    __slots__ = ('path',)
+
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        return self.path
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
 def rsc_as_file(path):
-    p = path
+    try:
+        p = os.fspath(path)
+    except TypeError:
+        p = str(path)
 
     # Find this path from the executable
-    if (isinstance(p, str) and not os.path.exists(p)) or (isinstance(p, (Path, Traversable)) and not p.exists()):
-        p = os.path.join(EXE_PATH, str(path))
-    if (isinstance(p, str) and not os.path.exists(p)) or (isinstance(p, (Path, Traversable)) and not p.exists()):
-        p = os.path.join(EXE_PATH, '', str(path))
+    if not os.path.exists(p):
+        p = exe_path_join(EXE_PATH, p)
 
-    yield Path(p)  # Documentation says should be Path object, but I noticed it was a string.
+    return FileContext(Path(p))  # Documentation says should be Path object, but I noticed it was a string.
 
 
 def rsc_read_binary(package, resource):
@@ -136,14 +187,38 @@ def rsc_read_text(package, resource, encoding='utf-8', errors='strict'):
     return files(package).joinpath(resource).read_text(encoding, errors)
 
 
+RSC_CONTENTS_CACHE = {}
+
+
 def rsc_contents(package):
     """Return an iterable of entries in 'package'.
 
     Note that not all entries are resources.  Specifically, directories are
     not considered resources.  Use `is_resource()` on each entry returned here
     to check if it is a resource or not.
+
+    The names are cached until the package directory modified time changes.
     """
-    return iter([p.name for p in files(package).iterdir()])
+    path = files(package)
+    try:
+        directory = os.fspath(path)
+        mtime = os.stat(directory).st_mtime_ns
+    except (TypeError, OSError):
+        return tuple(p.name for p in path.iterdir())  # Not a file system directory (zip)
+
+    try:
+        cache_mtime, names = RSC_CONTENTS_CACHE[package]
+        if cache_mtime == mtime:
+            return names
+    except (KeyError, TypeError):
+        pass
+
+    names = tuple(os.listdir(directory))
+    try:
+        RSC_CONTENTS_CACHE[package] = (mtime, names)
+    except TypeError:
+        pass
+    return names
 
 
 def rsc_is_resource(package, name):
@@ -151,22 +226,10 @@ def rsc_is_resource(package, name):
 
     Directories are *not* resources.
     """
-    pkg = files(package)
-    path = pkg.joinpath(name)
-    if path.exists() and not path.is_dir():
-        return True
-
     try:
-        package_contents = set(contents(package))
-    except (NotADirectoryError, FileNotFoundError):
-        return False
-    if name not in package_contents:
+        return files(package).joinpath(name).is_file()
+    except OSError:
         return False
-    # Just because the given file_name lives as an entry in the package's
-    # contents doesn't necessarily mean it's a resource.  Directories are not
-    # resources, so let's try to find out if it's a directory or not.
-    path = Path(pkg.__spec__.origin).parent / name
-    return path.is_file()
 
 
 if read_text is None:
@@ -1,9 +1,18 @@
 import os
 import sys
-import copy
-import atexit
+import json
+import mmap
+import stat
+import struct
+import weakref
+import hashlib
+import tempfile
+import importlib
+import functools
 import contextlib
-from .importlib_interface import EXE_PATH, Traversable, contents, is_resource, read_binary, read_text, files, as_file
+from concurrent.futures import ThreadPoolExecutor
+from .importlib_interface import \
+    EXE_PATH, exe_path_join, Traversable, contents, is_resource, read_binary, files, as_file
 
 try:
     from dataclasses import MISSING
@@ -11,11 +20,13 @@ except (ImportError, Exception):
     MISSING = object()
 
 
+
 __all__ = [
-    'ResourceNotAvailable', 'Resource', 'ResourceManagerInterface', 'ResourceManager',
+    'ResourceNotAvailable', 'Resource', 'ResourceManagerInterface', 'ResourceManager', 'MountedResources',
     'get_global_manager', 'set_global_manager', 'temp_manager', 'add_manager', 'remove_manager',
     'clear', 'register_resource', 'register', 'register_data', 'register_directory', 'unregister',
-    'has_resource', 'get_resources', 'get_resource', 'get_binary', 'get_text', 'registered_datas',
+    'has_resource', 'get_resources', 'get_resource', 'get_binary', 'get_text', 'preload', 'registered_datas',
+    'create_rman', 'mount', 'unmount', 'RMAN_FILENAME', 'RESOURCE_TABLE_MODULE',
     'MISSING'
     ]
 
@@ -24,7 +35,233 @@ class ResourceNotAvailable(Exception):
     pass
 
 
+# Errors raised by importlib when a package or resource cannot be read.
+READ_ERRORS = (ImportError, OSError, TypeError, ValueError, AttributeError)
+
+# Top level module generated by resource_man.pyinstaller.create_resource_table for frozen executables
+RESOURCE_TABLE_MODULE = 'resource_man_table'
+RESOURCE_TABLE = None
+
+
+def _get_resource_table():
+    """Return the frozen executable resource table. The table module is only imported when frozen."""
+    global RESOURCE_TABLE
+    if not getattr(sys, 'frozen', False):
+        return {}
+    if RESOURCE_TABLE is None:
+        try:
+            RESOURCE_TABLE = importlib.import_module(RESOURCE_TABLE_MODULE).TABLE
+        except (ImportError, Exception):
+            RESOURCE_TABLE = {}
+    return RESOURCE_TABLE
+
+
+# Cache the importlib package lookups. Set to False if packages change while the application is running.
+CACHE_LOOKUPS = True
+
+
+def _lookup_cache(func):
+    """Cache the lookup function results while CACHE_LOOKUPS is True."""
+    cached = functools.lru_cache(maxsize=None)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        if CACHE_LOOKUPS:
+            return cached(*args)
+        return func(*args)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_lookup_cache
+def _files_cached(package):
+    """Return the cached Traversable for the package, so the package is only imported and resolved once."""
+    return files(package)
+
+
+@_lookup_cache
+def _contents_cached(package):
+    """Return the cached contents of the package as a tuple."""
+    return tuple(contents(package))
+
+
+# Counter that changes whenever resources or linked managers change. Used to validate lookup caches.
+_REGISTRY_GENERATION = 0
+
+
+def _registry_changed():
+    """Increment the registry generation, so caches built from resource lookups are rebuilt."""
+    global _REGISTRY_GENERATION
+    _REGISTRY_GENERATION += 1
+
+
+def intern_str(value):
+    """Return the interned string, so equal identifiers share memory and compare by identity first."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+# Files larger than this are not kept in the read cache. Resource.read_mmap can be used for large files.
+MMAP_THRESHOLD = 1 << 20
+
+# Directory to save resources that were read from zip imported packages of a frozen executable. Set to None to
+# disable. The directory is only used when it is owned by this user and not accessible by other users.
+ZIP_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'resource_man_cache' +
+                             ('-{}'.format(os.getuid()) if hasattr(os, 'getuid') else ''))
+
+
+def _use_zip_cache():
+    """Return if the zip cache is used. Only frozen executables use the cache."""
+    return bool(ZIP_CACHE_DIR) and getattr(sys, 'frozen', False)
+
+
+@functools.lru_cache(maxsize=None)
+def _zip_cache_key(package, name):
+    """Return (zip archive, cache key) if the package was imported from a zip file else None."""
+    try:
+        module = importlib.import_module(package)
+    except (ImportError, TypeError, ValueError, Exception):
+        return None
+    archive = getattr(getattr(module, '__loader__', None), 'archive', None)  # zipimport.zipimporter
+    if not archive:
+        return None
+    return archive, '|'.join((str(archive), str(package), str(name)))
+
+
+def _zip_cache_path(archive, key):
+    """Return the cache filename for the current archive size and modified time or None if the archive is missing.
+
+    A rebuilt or restored archive has a different cache filename, so old cache files are never used.
+    """
+    try:
+        st = os.stat(archive)
+    except (OSError, TypeError, ValueError):
+        return None
+    key = '|'.join((key, str(st.st_size), str(st.st_mtime_ns))).encode('utf-8')
+    return os.path.join(ZIP_CACHE_DIR, hashlib.blake2b(key, digest_size=16).hexdigest())
+
+
+def _is_private_dir(directory):
+    """Return if the directory is a real directory owned by this user that other users cannot access."""
+    try:
+        st = os.lstat(directory)
+    except (OSError, TypeError, ValueError):
+        return False
+    if not stat.S_ISDIR(st.st_mode):
+        return False
+    if hasattr(os, 'getuid') and (st.st_uid != os.getuid() or st.st_mode & 0o077):
+        return False
+    return True
+
+
+def _read_zip_cache(path):
+    """Return the cached bytes or None if the cache file does not exist or the cache directory is not private."""
+    if not _is_private_dir(ZIP_CACHE_DIR):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _write_zip_cache(path, data):
+    """Atomically save the data in the private cache directory. Errors are ignored, the cache is optional."""
+    try:
+        os.makedirs(ZIP_CACHE_DIR, mode=0o700, exist_ok=True)
+        if not _is_private_dir(ZIP_CACHE_DIR):
+            return
+        fd, tmp = tempfile.mkstemp(dir=ZIP_CACHE_DIR)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            os.remove(tmp)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _exit_as_file(context):
+    """Exit the "as_file" context that a Resource entered to get the file path."""
+    try:
+        context.__exit__(None, None, None)
+    except (ResourceNotAvailable, OSError, TypeError, ValueError, Exception):
+        pass
+
+
+RMAN_FILENAME = 'resources.rman'
+RMAN_MAGIC = b'RMAN1\n'
+
+
+class MountedResources(object):
+    """Read only memory mapped file of resources that were saved with create_rman.
+
+    File Layout:
+        RMAN_MAGIC, table of contents length (little endian uint64), table of contents (utf-8 json
+        {package_path: [offset, length]}), resource data.
+    """
+    def __init__(self, filename):
+        self.filename = str(filename)
+        with open(self.filename, 'rb') as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            size = len(RMAN_MAGIC)
+            if self.mmap[:size] != RMAN_MAGIC:
+                raise ValueError('Invalid resource file "{}"'.format(self.filename))
+            toc_len = struct.unpack('<Q', self.mmap[size: size + 8])[0]
+            self.data_offset = size + 8 + toc_len
+            self.toc = json.loads(self.mmap[size + 8: self.data_offset].decode('utf-8'))
+        except (ValueError, TypeError, struct.error, Exception):
+            self.mmap.close()
+            raise
+
+    def __contains__(self, package_path):
+        return package_path in self.toc
+
+    def get(self, package_path, default=None):
+        """Return the bytes for the package path or the default value."""
+        try:
+            offset, length = self.toc[package_path]
+        except (KeyError, TypeError):
+            return default
+        start = self.data_offset + offset
+        return self.mmap[start: start + length]
+
+    def close(self):
+        """Close the memory map."""
+        self.mmap.close()
+
+
+# Managers with a mounted resource file. create_rman saves the linked manager resources, so a mounted file also
+# serves the resources of the linked managers.
+_MOUNTED_MANAGERS = []
+
+
+def _links_manager(parent, manager):
+    """Return if the manager is the parent or one of the parent's linked managers. Managers compare by identity."""
+    stack = [parent]
+    seen = set()
+    while stack:
+        man = stack.pop()
+        if man is manager:
+            return True
+        if id(man) not in seen:
+            seen.add(id(man))
+            stack.extend(getattr(man, 'managers', None) or [])
+    return False
+
+
 class Resource:
+    # Known attributes use slots. "__dict__" keeps support for arbitrary keyword argument attributes.
+    __slots__ = ('manager', '_package', '_name', '_raw_alias', '_package_path', '_alias', '_data',
+                 '_context', '_context_obj', '_cache', '_cache_mtime', '_cache_path', '_text_cache', '_str_cache',
+                 '_mmap', '_mmap_mtime', '_finalizer', '_package_dir', '_ext_lower',
+                 '__dict__', '__weakref__')
+
     def __init__(self, package, name, alias=MISSING, manager=None, data=None, **kwargs):
         """Initialize the resource object.
 
@@ -39,12 +276,26 @@ class Resource:
             **kwargs (dict): Dictionary of keyword arguments to set as resource attributes.
         """
         self.manager = manager
-        self.raw_alias = alias
-        self.package = package
-        self.name = name
-        self.data = data
+        self._package = intern_str(package)
+        self._name = intern_str(name)
+        self._raw_alias = intern_str(alias)
+        self._package_path = None
+        self._alias = None
+        self._data = data
         self._context = None
         self._context_obj = None
+        self._str_cache = None  # Resolved file path string
+        self._finalizer = None
+
+        # File read cache validated by the file modified time
+        self._cache = None
+        self._cache_mtime = None
+        self._cache_path = None
+        self._text_cache = {}
+        self._mmap = None
+        self._mmap_mtime = None
+
+        self._update_identifiers()
 
         # Set all keyword arguments as attributes
         for k, v in kwargs.items():
@@ -53,28 +304,97 @@ class Resource:
             except (AttributeError, TypeError, ValueError, Exception):
                 pass
 
-    @property
-    def package_path(self):
-        """Return the package path."""
-        pkg = self.package.replace('.', '/')
-        name = self.name
+    def _update_identifiers(self):
+        """Compute the package path and alias, so lookups and comparisons do not rebuild the strings."""
+        pkg = (self._package or '').replace('.', '/')
+        name = self._name
         if pkg and name:
-            return '/'.join((pkg, self.name))
+            self._package_path = intern_str('/'.join((pkg, name)))
         elif pkg:
-            return pkg
+            self._package_path = intern_str(pkg)
         else:
-            return name
+            self._package_path = name
+        self._package_dir = None
+        self._ext_lower = None
+
+        if self._raw_alias is MISSING:
+            self._alias = self._package_path
+        elif self._raw_alias is ...:
+            self._alias = name
+        elif self._raw_alias is None:
+            self._alias = intern_str(os.path.splitext(name)[0])
+        else:
+            self._alias = self._raw_alias
+
+    def _reindex_manager(self):
+        """Update the manager alias lookup after the package path or alias changed."""
+        try:
+            self.manager.reindex()
+        except (AttributeError, TypeError, Exception):
+            pass
+
+    @property
+    def package(self):
+        """Return the package or module name."""
+        return self._package
+
+    @package.setter
+    def package(self, value):
+        self._package = intern_str(value)
+        self.invalidate()  # The cached data belongs to the old file
+        if self._context is not None:
+            self._exit_context()
+        self._update_identifiers()
+        self._reindex_manager()
+
+    @property
+    def name(self):
+        """Return the resource name."""
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = intern_str(value)
+        self.invalidate()  # The cached data belongs to the old file
+        if self._context is not None:
+            self._exit_context()
+        self._update_identifiers()
+        self._reindex_manager()
+
+    @property
+    def raw_alias(self):
+        """Return the given alias value (MISSING, ..., None, or str)."""
+        return self._raw_alias
+
+    @raw_alias.setter
+    def raw_alias(self, value):
+        self._raw_alias = intern_str(value)
+        self._update_identifiers()
+        self._reindex_manager()
+
+    @property
+    def package_path(self):
+        """Return the package path."""
+        return self._package_path
+
+    @property
+    def package_dir(self):
+        """Return the directory of the package path (EX: "mylib/mysubpkg" for "mylib/mysubpkg/myimg.png")."""
+        if self._package_dir is None:
+            self._package_dir = os.path.dirname(self._package_path or '')
+        return self._package_dir
+
+    @property
+    def ext_lower(self):
+        """Return the lower case extension of the name (EX: ".png" for "MyImg.PNG")."""
+        if self._ext_lower is None:
+            self._ext_lower = os.path.splitext(self._name or '')[-1].lower()
+        return self._ext_lower
 
     @property
     def alias(self):
         """Return the alias name identifier."""
-        if self.raw_alias is MISSING:
-            return self.package_path
-        elif self.raw_alias is ...:
-            return self.name
-        elif self.raw_alias is None:
-            return os.path.splitext(self.name)[0]
-        return self.raw_alias
+        return self._alias
 
     @alias.setter
     def alias(self, value):
@@ -90,7 +410,7 @@ class Resource:
         names will return False.
         """
         try:
-            return is_resource(self.package, self.name)
+            return is_resource(self.package, self.name)  # Not cached. Files can be removed.
         except (AttributeError, TypeError, ValueError, Exception):
             try:
                 f = self.files()
@@ -100,7 +420,7 @@ class Resource:
 
     def files(self):
         try:
-            return files(self.package).joinpath(self.name)
+            return _files_cached(self.package).joinpath(self.name)
         except (AttributeError, TypeError, ValueError, Exception):
             return Traversable(self.package_path)
 
@@ -124,103 +444,247 @@ class Resource:
         except (ValueError, TypeError, Exception):
             pass
         try:
-            return contents(self.package)
+            return list(_contents_cached(self.package))
         except (ValueError, TypeError, Exception):
             return []
 
-    def read_bytes(self):
-        error = None
-        if isinstance(self.data, bytes):
-            return self.data
-        elif isinstance(self.data, str):
-            return self.data.encode('utf-8')
-        elif self.data is not None:
+    @property
+    def data(self):
+        """Return the stored data or None if the resource is file based."""
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._str_cache = None
+
+    def invalidate(self):
+        """Clear the cached file data and path, so the next read uses the file."""
+        self._cache = None
+        self._cache_mtime = None
+        self._cache_path = None
+        self._text_cache = {}
+        self._str_cache = None
+        self._close_mmap()
+
+    def _close_mmap(self):
+        """Close the memory map from read_mmap."""
+        mapped = self._mmap
+        self._mmap = None
+        self._mmap_mtime = None
+        if mapped is not None:
             try:
-                return bytes(self.data)
-            except (AttributeError, TypeError, OSError, Exception) as err:
-                error = err
+                mapped.close()
+            except BufferError:
+                pass  # A memoryview still uses the map. The map is closed when it is garbage collected.
+
+    def _file_mtime(self):
+        """Return the modified time of the resource file or None if the file is not on the file system."""
+        try:
+            if self._cache_path is None:
+                self._cache_path = os.fspath(self.files())
+            return os.stat(self._cache_path).st_mtime_ns
+        except (TypeError, ValueError, OSError, Exception):
+            return None
+
+    def _validate_cache(self):
+        """Clear the cached file data if the file was modified."""
+        mtime = self._file_mtime()
+        if mtime != self._cache_mtime:
+            self._cache = None
+            self._cache_mtime = mtime
+            self._text_cache = {}
+
+    def _read_mounted(self):
+        """Return the bytes from the mounted resource file of the manager or a manager linking it, or None."""
+        if not _MOUNTED_MANAGERS:
+            return None
+
+        manager = self.manager
+        try:
+            data = manager.mounted.get(self._package_path)
+            if data is not None:
+                return data
+        except (AttributeError, TypeError, ValueError, Exception):
+            pass
+
+        for man in _MOUNTED_MANAGERS:
+            if man is not manager and _links_manager(man, manager):
+                try:
+                    data = man.mounted.get(self._package_path)
+                except (AttributeError, TypeError, ValueError, Exception):
+                    continue
+                if data is not None:
+                    return data
+        return None
+
+    def read_bytes(self):
+        data = self.data
+        if data is None:
+            mounted = self._read_mounted()
+            if mounted is not None:
+                return mounted
+
+            # Frozen executable files do not change. Check the table before resolving the path through importlib.
+            table_path = _get_resource_table().get((self._package, self._name), None)
+            if table_path is not None:
+                if self._cache is not None:
+                    return self._cache
                 try:
-                    return str(self.data).encode('utf-8')
-                except (AttributeError, TypeError, OSError, Exception):
+                    with open(exe_path_join(EXE_PATH, table_path), 'rb') as f:
+                        self._cache = f.read()
+                    return self._cache
+                except OSError:
                     pass
-        else:
+
+            self._validate_cache()
+            if self._cache is not None:
+                return self._cache
+
+            # Zip imported packages decompress the data every time. Use the on disk cache.
+            zip_cache = None
+            if _use_zip_cache():
+                zip_key = _zip_cache_key(self._package, self._name)
+                zip_cache = _zip_cache_path(*zip_key) if zip_key is not None else None
+            if zip_cache is not None:
+                self._cache = _read_zip_cache(zip_cache)
+                if self._cache is not None:
+                    return self._cache
+
             try:
-                self.data = read_binary(self.package, self.name)
-                return self.data
-            except (AttributeError, TypeError, OSError, Exception) as err:
-                error = err
+                data = read_binary(self.package, self.name)
+            except READ_ERRORS as err:
                 try:
-                    self.data = self.files().read_bytes()
-                    return self.data
-                except (AttributeError, TypeError, OSError, Exception):
-                    pass
-        raise ResourceNotAvailable(str(error))
+                    data = self.files().read_bytes()
+                except READ_ERRORS:
+                    raise ResourceNotAvailable(str(err)) from err
+
+            if zip_cache is not None:
+                _write_zip_cache(zip_cache, data)
+            if len(data) <= MMAP_THRESHOLD:
+                self._cache = data  # Do not keep large files in memory. Use read_mmap for large files.
+            return data
+        elif isinstance(data, bytes):
+            return data
+        elif isinstance(data, str):
+            return data.encode('utf-8')
+        elif isinstance(data, (bytearray, memoryview)):
+            return bytes(data)
+        else:
+            try:
+                return bytes(data)
+            except (TypeError, ValueError):
+                return str(data).encode('utf-8')
 
     read_binary = read_bytes
 
+    def read_mmap(self):
+        """Return a read only memory map of the resource file.
+
+        The memory map supports the buffer protocol (bytes(), memoryview()) without reading the file into memory.
+        Data resources and resources that are not on the file system return the bytes from read_bytes.
+
+        The resource owns the memory map. Do not close it. The map is closed and a new map is returned when the file
+        is modified, and it is closed by invalidate() or when the package or name changes. Copy the data that needs
+        to be kept after that.
+        """
+        if self.data is None:
+            mtime = self._file_mtime()
+            if self._mmap is not None:
+                if not self._mmap.closed and mtime is not None and mtime == self._mmap_mtime:
+                    return self._mmap
+                self._close_mmap()  # The file was replaced or modified
+
+            try:
+                with open(os.fspath(self.files()), 'rb') as f:
+                    self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._mmap_mtime = mtime
+                return self._mmap
+            except (OSError, TypeError, ValueError):  # Not on the file system or empty file
+                pass
+        return self.read_bytes()
+
     def read_text(self, encoding='utf-8', errors='strict'):
-        error = None
-        if isinstance(self.data, str):
-            return self.data
-        elif isinstance(self.data, bytes):
-            return self.data.decode(encoding, errors)
-        elif self.data is not None:
+        data = self.data
+        if data is None:
+            key = (encoding, errors)
+            self._validate_cache()
             try:
-                return bytes(self.data)
-            except (AttributeError, TypeError, OSError, Exception) as err:
-                error = err
-                try:
-                    return str(self.data).encode('utf-8')
-                except (AttributeError, TypeError, OSError, Exception):
-                    pass
+                return self._text_cache[key]
+            except KeyError:
+                pass
+
+            # Decode the cached raw bytes with universal newlines like a text mode open
+            data = self.read_bytes()
+            try:
+                text = data.decode(encoding, errors)
+            except (UnicodeError, LookupError) as err:
+                raise ResourceNotAvailable(str(err)) from err
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            if len(data) <= MMAP_THRESHOLD:
+                self._text_cache[key] = text  # Large files are not kept in memory, the same as read_bytes
+            return text
+        elif isinstance(data, str):
+            return data
+        elif isinstance(data, bytes):
+            return data.decode(encoding, errors)
+        elif isinstance(data, (bytearray, memoryview)):
+            return bytes(data).decode(encoding, errors)
         else:
             try:
-                self.data = read_text(self.package, self.name, encoding, errors)
-                return self.data
-            except (AttributeError, TypeError, OSError, Exception) as err:
-                error = err
-                try:
-                    self.data = self.files().read_text(encoding, errors)
-                    return self.data
-                except (AttributeError, TypeError, OSError, Exception):
-                    pass
-        raise ResourceNotAvailable(str(error))
+                return bytes(data).decode(encoding, errors)
+            except (TypeError, ValueError):
+                return str(data)
 
     def _enter_context(self):
         """Use "as_file" to enter the with context block for the life of the application in order to get the filepath.
         """
+        if self._context is not None or self._context_obj is not None:
+            return  # Only enter once. Zip resources would extract a new temporary file every time.
+
         if self.data is not None and not isinstance(self.data, (bytes, str)):
             self._context_obj = self.data
         else:
-            self._context = self.as_file()
-            self._context_obj = self._context.__enter__()
+            context = as_file(self.files())  # Not self.as_file(). The generator would keep a reference to self
+            self._context_obj = context.__enter__()
+            self._context = context
+
+            # Exit when this resource is garbage collected or at exit. This does not keep the resource alive.
+            self._finalizer = weakref.finalize(self, _exit_as_file, context)
 
         try:
             self._context_obj = self._context_obj.resolve()  # Get proper path capitalization
         except (AttributeError, Exception):
             pass
-        atexit.register(self._exit_context)
 
     def _exit_context(self):
         """Exit the context object that was used with "as_file"."""
+        finalizer = self._finalizer
+        self._finalizer = None
         try:
-            self._context.__exit__()
-        except (ResourceNotAvailable, OSError, TypeError, ValueError, Exception):
-            pass
+            if finalizer is not None:
+                finalizer()  # Only runs once
         finally:
             self._context_obj = None
             self._context = None
+            self._str_cache = None
 
     def __str__(self):
         """Return the full string file path. I'm not sure if this will always work. "as_file" should be used."""
+        if self._str_cache is not None:
+            return self._str_cache
+
         try:
             if self._context_obj:
-                return str(self._context_obj)
+                self._str_cache = str(self._context_obj)
+                return self._str_cache
 
             # Use "as_file" to enter the context and return the filepath
             self._enter_context()
             if self._context_obj:
-                return str(self._context_obj)
+                self._str_cache = str(self._context_obj)
+                return self._str_cache
 
             # Use files to return the path. Should I even do this?
             filename = self.files()
@@ -228,18 +692,19 @@ class Resource:
                 filename = filename.resolve()
             except (AttributeError, OSError, Exception):
                 pass
-            return str(filename)
+            self._str_cache = str(filename)
+            return self._str_cache
         except (ResourceNotAvailable, OSError, TypeError, ValueError, Exception):
             pass
 
         # Return the simple package path from the working directory.
-        pp = orig_pp = str(self.package_path)
-        if not os.path.exists(pp):
-            pp = os.path.join(EXE_PATH, pp)
-            if not os.path.exists(pp):
-                pp = os.path.join(EXE_PATH, '', pp)
-            if not os.path.exists(pp):
-                pp = orig_pp
+        pp = str(self.package_path)
+        if os.path.exists(pp):
+            self._str_cache = pp
+        else:
+            exe_pp = exe_path_join(EXE_PATH, pp)
+            if os.path.exists(exe_pp):
+                self._str_cache = pp = exe_pp
         return pp
 
     def __fspath__(self):
@@ -247,10 +712,24 @@ class Resource:
         return self.__str__()
 
     def __eq__(self, other):
-        if isinstance(other, str):
-            return other == self.alias or \
-                   other.replace('\\', '/') == self.package_path
-        return super().__eq__(other)
+        if other is self:
+            return True
+        elif other.__class__ is str or isinstance(other, str):
+            if other == self._alias:
+                return True
+            if '\\' in other:
+                other = other.replace('\\', '/')
+            return other == self._package_path
+        elif isinstance(other, Resource):
+            return False  # Different resource objects are not equal. Skip the reflected comparison.
+        return NotImplemented
+
+    def __hash__(self):
+        """Hash with the alias, so a Resource can be used to find the alias key in a dict.
+
+        Do not change the alias while the resource is stored in a set or as a dict key.
+        """
+        return hash(self._alias)
 
     def __repr__(self):
         kwargs = {'cls': self.__class__.__name__, 'package': self.package, 'name': self.name, 'alias': self.alias}
@@ -263,6 +742,8 @@ class ResourceManagerInterface(object):
     def __init__(self, *resources, **kwargs):
         if not hasattr(self, 'managers'):
             self.managers = []
+        if not hasattr(self, 'mounted'):
+            self.mounted = None
 
         super(ResourceManagerInterface, self).__init__()
         self.init(*resources, **kwargs)
@@ -308,6 +789,7 @@ class ResourceManagerInterface(object):
             except (AttributeError, TypeError, ValueError, Exception):
                 pass
         self.managers.append(man)
+        _registry_changed()
 
     def remove_manager(self, man):
         """Remove a linked manager."""
@@ -315,6 +797,7 @@ class ResourceManagerInterface(object):
             self.managers.remove(man)
         except (TypeError, ValueError, Exception):
             pass
+        _registry_changed()
 
     def register_resource(self, rsc, **kwargs):
         """Register a resource.
@@ -381,32 +864,50 @@ class ResourceManagerInterface(object):
             directory (list): List of Resource objects that were registered.
         """
         if isinstance(extensions, str):
-            extensions = [extensions]
+            extensions = frozenset([extensions])
+        elif extensions is not None:
+            extensions = frozenset(extensions)
         if exclude is None:
-            exclude = []
+            exclude = frozenset()
         elif isinstance(exclude, str):
-            exclude = [exclude]
+            exclude = frozenset([exclude])
+        else:
+            exclude = frozenset(exclude)
         directory = directory or ''
+        splitext = os.path.splitext
 
         folder = []
-        pkg = files(package).joinpath(directory)
+        pkg = _files_cached(package).joinpath(directory)
+        if not recursive:
+            # Use scandir for file system packages, so DirEntry.is_file does not need another stat call
+            try:
+                with os.scandir(os.fspath(pkg)) as it:
+                    names = [entry.name for entry in it if entry.is_file()]
+            except (TypeError, ValueError, OSError):
+                names = None  # Not on the file system (zip file). Use the Traversable below
+
+            if names is not None:
+                for name in names:
+                    if (name not in exclude) and (extensions is None or splitext(name)[-1] in extensions):
+                        path = os.path.join(directory, name).replace('\\', '/')  # Normalize path with the directory
+                        folder.append(self.register(package, path, **kwargs))
+                return folder
+
         if directory or recursive:
             if recursive:
-                iter_dir = pkg.glob('**/*')
+                iter_dir = pkg.rglob('*')
             else:
                 iter_dir = pkg.iterdir()
             for f in iter_dir:
                 name = str(f.relative_to(pkg))
-                ext = os.path.splitext(name)[-1]
-                if not f.is_dir() and (name not in exclude) and (extensions is None or ext in extensions):
+                if (name not in exclude) and (extensions is None or splitext(name)[-1] in extensions) and f.is_file():
                     path = os.path.join(directory, name).replace('\\', '/')  # Normalize path with the directory
                     folder.append(self.register(package, path, **kwargs))
         else:
-            for name in contents(package):
+            for name in _contents_cached(package):
                 name = str(name)
-                ext = os.path.splitext(name)[-1]
-                f = pkg.joinpath(name)
-                if not f.is_dir() and (name not in exclude) and (extensions is None or ext in extensions):
+                if (name not in exclude) and (extensions is None or splitext(name)[-1] in extensions) and \
+                        pkg.joinpath(name).is_file():
                     folder.append(self.register(package, name, **kwargs))
 
         return folder
@@ -430,10 +931,10 @@ class ResourceManagerInterface(object):
         elif isinstance(alias, str):
             rsc = alias
 
-        for i in reversed(range(len(self))):
-            resource = self[i]
+        last = len(self) - 1
+        for offset, resource in enumerate(reversed(self)):
             if resource == rsc:
-                return self.pop(i)
+                return self.pop(last - offset)
 
         raise ResourceNotAvailable('Resource not found! If "package" given then the "name" argument is required.')
 
@@ -459,13 +960,19 @@ class ResourceManagerInterface(object):
         if rsc_list is None:
             rsc_list = []
 
-        for rsc in reversed(self):
-            if allow_duplicates or rsc not in rsc_list:
-                rsc_list.append(rsc)
+        if not allow_duplicates:
+            # Collect everything once, then keep the first occurrence of each object with a seen set
+            seen = {id(rsc) for rsc in rsc_list}
+            for rsc in self.get_resources(include_managers=include_managers, allow_duplicates=True):
+                if id(rsc) not in seen:
+                    seen.add(id(rsc))
+                    rsc_list.append(rsc)
+            return rsc_list
 
+        rsc_list.extend(reversed(self))
         if include_managers and getattr(self, 'managers', None):
             for man in reversed(self.managers):
-                man.get_resources(include_managers=True, allow_duplicates=allow_duplicates, rsc_list=rsc_list)
+                man.get_resources(include_managers=True, allow_duplicates=True, rsc_list=rsc_list)
 
         return rsc_list
 
@@ -487,12 +994,13 @@ class ResourceManagerInterface(object):
             pass
 
         # Try fallback
-        try:
-            if isinstance(fallback, Resource):
-                return fallback
-            return self[fallback]
-        except (KeyError, IndexError, ResourceNotAvailable, Exception):
-            pass
+        if isinstance(fallback, Resource):
+            return fallback
+        elif fallback is not None:
+            try:
+                return self[fallback]
+            except (KeyError, IndexError, ResourceNotAvailable, Exception):
+                pass
 
         # Check default
         if default is MISSING:
@@ -533,6 +1041,68 @@ class ResourceManagerInterface(object):
             return rsc.read_text(encoding=encoding, errors=errors)
         return rsc
 
+    def preload(self, resources=None, max_workers=None):
+        """Read the binary data for many resources at once using a thread pool.
+
+        The data of files up to MMAP_THRESHOLD bytes is kept in each Resource read cache, so later reads do not open
+        the file. Larger files are only read to check that they are available.
+
+        Args:
+            resources (list)[None]: Alias names, package paths, or Resource objects. If None use all resources.
+            max_workers (int)[None]: Number of threads to read with. If None use the ThreadPoolExecutor default.
+
+        Returns:
+            resources (list): List of Resource objects that were read.
+        """
+        if resources is None:
+            resources = self.get_resources()
+        else:
+            resources = [self.get_resource(rsc, default=None) for rsc in resources]
+        resources = [rsc for rsc in resources if isinstance(rsc, Resource)]
+
+        def read(rsc):
+            try:
+                rsc.read_bytes()
+                return True
+            except (ResourceNotAvailable, OSError, Exception):
+                return False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            success = list(executor.map(read, resources))
+        return [rsc for rsc, read_ok in zip(resources, success) if read_ok]
+
+    def mount(self, filename=RMAN_FILENAME):
+        """Read resource data from a file created with create_rman instead of the package files.
+
+        Args:
+            filename (str)['resources.rman']: Resource file. If not found the executable path is checked.
+
+        Returns:
+            success (bool): True if the file was mounted. If False resources are read from the packages.
+        """
+        filename = str(filename)
+        if not os.path.exists(filename):
+            filename = exe_path_join(EXE_PATH, filename)
+
+        try:
+            mounted = MountedResources(filename)
+        except (OSError, ValueError, TypeError, Exception):
+            return False
+
+        self.unmount()
+        self.mounted = mounted
+        _MOUNTED_MANAGERS.append(self)
+        return True
+
+    def unmount(self):
+        """Close the mounted resource file and read resources from the packages."""
+        mounted, self.mounted = self.mounted, None
+        _MOUNTED_MANAGERS[:] = [man for man in _MOUNTED_MANAGERS if man is not self]
+        try:
+            mounted.close()
+        except (AttributeError, Exception):
+            pass
+
 
 class ResourceManager(list, ResourceManagerInterface):
 
@@ -540,11 +1110,45 @@ class ResourceManager(list, ResourceManagerInterface):
 
     def __init__(self, *resources, **kwargs):
         list.__init__(self)
+        self._index = {}  # Alias and package path lookup. The last registered resource is used.
         ResourceManagerInterface.__init__(self, *resources, **kwargs)
 
     __iter__ = list.__iter__
 
+    def snapshot(self):
+        """Return a shallow copy with its own lookup index and linked manager list."""
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new.managers = list(self.managers)
+        list.extend(new, self)  # Keep the resource's manager
+        new.reindex()
+        return new
+
+    __copy__ = snapshot
+
+    def _index_resource(self, resource):
+        """Add the resource alias and package path to the lookup index."""
+        _registry_changed()
+        try:
+            self._index[resource.package_path] = resource
+            self._index[resource.alias] = resource
+        except (AttributeError, TypeError, Exception):
+            pass
+
+    def reindex(self):
+        """Rebuild the alias and package path lookup index."""
+        _registry_changed()
+        self._index = {}
+        for resource in self:
+            self._index_resource(resource)
+
     def __contains__(self, item):
+        if isinstance(item, str):
+            if item in self._index:
+                return True
+        elif isinstance(item, Resource) and (self._index.get(item.alias, None) is item or
+                                             self._index.get(item.package_path, None) is item):
+            return True
         if list.__contains__(self, item):
             return True
 
@@ -555,51 +1159,236 @@ class ResourceManager(list, ResourceManagerInterface):
 
         return False
 
-    def __getitem__(self, item):
-        if isinstance(item, int):
-            return list.__getitem__(self, item)
+    def get(self, key, default=None):
+        """Return the resource for the alias name identifier or package path or the default value.
 
-        # Check self first
-        for rsc in reversed(self):
-            if rsc == item:
+        This is a dict style lookup that does not raise an error when the resource is not found.
+        """
+        search_self = True
+        if isinstance(key, str):
+            rsc = self._index.get(key, MISSING)
+            if rsc is not MISSING:
                 return rsc
+            search_self = '\\' in key or key.startswith(':')  # Only Windows paths and the qt_name are not indexed
+        elif isinstance(key, (int, slice)):
+            try:
+                return list.__getitem__(self, key)
+            except IndexError:
+                return default
+
+        # Check self for other names (Windows paths, qt_name)
+        if search_self:
+            for rsc in reversed(self):
+                if rsc == key:
+                    return rsc
 
         # Search through all linked managers
         for man in reversed(self.managers):
+            if isinstance(man, ResourceManager):
+                rsc = man.get(key, MISSING)
+                if rsc is not MISSING:
+                    return rsc
+            else:
+                try:
+                    return man[key]
+                except (KeyError, IndexError, ResourceNotAvailable, Exception):
+                    pass
+
+        return default
+
+    def get_resource(self, rsc, fallback=None, default=MISSING):
+        """Return the found Resource object from the given resource, fallback, or default value.
+
+        Args:
+            rsc (str/Resource): Alias name identifier, package path, or Resource object that has a registered resource
+            fallback (str)[None]: Fallback alias if the given alias was not registered.
+            default (object)[MISSING]: Default value to return if the alias and fallback were not found.
+
+        Returns:
+            rsc (Resource): The found Resource object.
+        """
+        found = self.get(rsc, MISSING)
+        if found is not MISSING:
+            return found
+
+        # Try fallback
+        if isinstance(fallback, Resource):
+            return fallback
+        elif fallback is not None:
+            found = self.get(fallback, MISSING)
+            if found is not MISSING:
+                return found
+
+        # Check default
+        if default is MISSING:
+            raise ResourceNotAvailable('Resource "{}" not found'.format(rsc))
+        return default
+
+    def get_binary(self, rsc, fallback=None, default=MISSING):
+        """Return the binary data for the Resource object from the given identifier or default.
+
+        Args:
+            rsc (str/Resource): Alias name identifier, package path, or Resource object that has a registered resource
+            fallback (str)[None]: Fallback alias if the given alias was not registered.
+            default (object)[MISSING]: Default value to return if the alias and fallback were not found.
+
+        Returns:
+            data (bytes): Binary data that was read.
+        """
+        resource = self._index.get(rsc, None) if isinstance(rsc, str) else None
+        if resource is not None:
+            return resource.read_bytes()
+        return ResourceManagerInterface.get_binary(self, rsc, fallback=fallback, default=default)
+
+    def get_text(self, rsc, fallback=None, default=MISSING, encoding='utf-8', errors='strict'):
+        """Return the text data for the Resource object from the given identifier or default.
+
+        Args:
+            rsc (str/Resource): Alias name identifier, package path, or Resource object that has a registered resource
+            fallback (str)[None]: Fallback alias if the given alias was not registered.
+            default (object)[MISSING]: Default value to return if the alias and fallback were not found.
+            encoding (str)['utf-8']: Encoding to convert binary data to text.
+            errors (str)['strict']: Error handling code when converting the binary data to text.
+
+        Returns:
+            text (str): Text data that was read.
+        """
+        resource = self._index.get(rsc, None) if isinstance(rsc, str) else None
+        if resource is not None:
+            return resource.read_text(encoding=encoding, errors=errors)
+        return ResourceManagerInterface.get_text(self, rsc, fallback=fallback, default=default,
+                                                 encoding=encoding, errors=errors)
+
+    def unregister(self, rsc=None, name=None, alias=None):
+        """Unregister a resource.
+
+        Args:
+            rsc (str/Resource)[None]: Resource to unregister or package name (with name argument) or alias.
+            name (str)[None]: Required if package name given
+            alias (str)[None]: Alias name identifier to find. This may also be given as first argument.
+
+        Returns:
+            rsc (Resource): Resource that was found
+
+        Raises:
+            error (ResourceNotAvailable): Resource was not found!
+        """
+        if isinstance(rsc, str) and isinstance(name, str):
+            key = '/'.join((rsc.replace('.', '/'), name))
+        elif isinstance(alias, str):
+            key = alias
+        else:
+            key = rsc
+
+        # Find the resource with the index, so only the list position has to be searched
+        found = self._index.get(key, None) if isinstance(key, str) else key
+        if found is None and isinstance(key, str) and '\\' in key:
+            # Normalize a Windows package path once instead of in every comparison
+            key = key.replace('\\', '/')
+            found = self._index.get(key, None)
+            if found is not None and found.package_path != key:
+                found = None
+        if found is not None:
             try:
-                return man[item]
-            except (KeyError, IndexError, ResourceNotAvailable, Exception):
+                return self.pop(list.index(self, found))
+            except ValueError:
                 pass
 
-        raise ResourceNotAvailable("The requested resource \"{}\" was not found!".format(item))
+        return ResourceManagerInterface.unregister(self, rsc, name=name, alias=alias)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, slice)):
+            return list.__getitem__(self, item)
+
+        rsc = self.get(item, MISSING)
+        if rsc is MISSING:
+            raise ResourceNotAvailable("The requested resource \"{}\" was not found!".format(item))
+        return rsc
 
     def __setitem__(self, key, value):
-        if isinstance(key, int):
+        if isinstance(key, (int, slice)):
             list.__setitem__(self, key, value)
+            self.reindex()
             return
         elif isinstance(key, self.RESOURCE_CLASS):
             key = key.alias or key.package_path
 
         # Find the resource and replace the identifier
-        for i in reversed(range(len(self))):
-            rsc = self[i]
+        found = self._index.get(key, None)
+        if found is not None and found.alias == key:
+            try:
+                list.__setitem__(self, list.index(self, found), value)
+                self.reindex()
+                return
+            except ValueError:
+                pass
+
+        last = len(self) - 1
+        for offset, rsc in enumerate(reversed(self)):
             if rsc.alias == key:
-                list.__setitem__(i, value)
+                list.__setitem__(self, last - offset, value)
+                self.reindex()
                 return
 
         # If not found add the resource to the list.
         self.append(value)
 
+    def __delitem__(self, key):
+        list.__delitem__(self, key)
+        self.reindex()
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
     def append(self, resource):
         if hasattr(resource, 'manager') and resource.manager is None:
             resource.manager = self
-        return list.append(self, resource)
+        list.append(self, resource)
+        self._index_resource(resource)
+
+    def extend(self, resources):
+        for resource in resources:
+            self.append(resource)
+
+    def insert(self, index, resource):
+        if hasattr(resource, 'manager') and resource.manager is None:
+            resource.manager = self
+        list.insert(self, index, resource)
+        self.reindex()
+
+    def pop(self, index=-1):
+        resource = list.pop(self, index)
+        self.reindex()
+        return resource
+
+    def remove(self, resource):
+        list.remove(self, resource)
+        self.reindex()
+
+    def clear(self):
+        list.clear(self)
+        self._index = {}
+        _registry_changed()
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self.reindex()
 
-    pop = list.pop
+    def reverse(self):
+        list.reverse(self)
+        self.reindex()
 
 
 RESOURCE_MANAGER = ResourceManager()
 
+# Bound methods of the global manager, so the module level functions skip the get_global_manager call
+_REGISTER = RESOURCE_MANAGER.register
+_HAS_RESOURCE = RESOURCE_MANAGER.has_resource
+_GET_RESOURCE = RESOURCE_MANAGER.get_resource
+_GET_BINARY = RESOURCE_MANAGER.get_binary
+_GET_TEXT = RESOURCE_MANAGER.get_text
+
 
 def get_global_manager():
     """Return the global ResourceManager."""
@@ -609,8 +1398,14 @@ def get_global_manager():
 
 def set_global_manager(manager):
     """Set the global ResourceManager."""
-    global RESOURCE_MANAGER
+    global RESOURCE_MANAGER, _REGISTER, _HAS_RESOURCE, _GET_RESOURCE, _GET_BINARY, _GET_TEXT
     RESOURCE_MANAGER = manager
+    _registry_changed()
+    _REGISTER = manager.register
+    _HAS_RESOURCE = manager.has_resource
+    _GET_RESOURCE = manager.get_resource
+    _GET_BINARY = manager.get_binary
+    _GET_TEXT = manager.get_text
 
 
 @contextlib.contextmanager
@@ -636,6 +1431,9 @@ def remove_manager(man):
 
 def clear():
     """Clear out all of the resources that are registered."""
+    _files_cached.cache_clear()
+    _contents_cached.cache_clear()
+    _zip_cache_key.cache_clear()
     get_global_manager().clear()
 
 
@@ -651,7 +1449,7 @@ def register(package, name, alias=MISSING, **kwargs):
             None will be the name without the extension (EX: "myimg")
         **kwargs (dict): Dictionary of keyword arguments to set as attributes to the resource.
     """
-    return get_global_manager().register(package, name, alias=alias, **kwargs)
+    return _REGISTER(package, name, alias=alias, **kwargs)
 
 
 def register_data(data, package, name, alias=MISSING, **kwargs):
@@ -722,7 +1520,7 @@ def unregister(rsc=None, name=None, alias=None):
 
 def has_resource(rsc=None, name=None, alias=None):
     """Return if the registered resource exists (this can be the alias, resource, or package_path."""
-    return get_global_manager().has_resource(rsc=rsc, name=name, alias=alias)
+    return _HAS_RESOURCE(rsc=rsc, name=name, alias=alias)
 
 
 def get_resources(include_managers=True, allow_duplicates=False, rsc_list=None):
@@ -745,7 +1543,7 @@ def get_resource(rsc, fallback=None, default=MISSING):
     Returns:
         rsc (Resource): The found Resource object.
     """
-    return get_global_manager().get_resource(rsc, fallback=fallback, default=default)
+    return _GET_RESOURCE(rsc, fallback=fallback, default=default)
 
 
 def get_binary(rsc, fallback=None, default=MISSING):
@@ -759,7 +1557,7 @@ def get_binary(rsc, fallback=None, default=MISSING):
     Returns:
         data (bytes): Binary data that was read.
     """
-    return get_global_manager().get_binary(rsc, fallback=fallback, default=default)
+    return _GET_BINARY(rsc, fallback=fallback, default=default)
 
 
 def get_text(rsc, fallback=None, default=MISSING, encoding='utf-8', errors='strict'):
@@ -775,7 +1573,87 @@ def get_text(rsc, fallback=None, default=MISSING, encoding='utf-8', errors='stri
     Returns:
         text (str): Text data that was read.
     """
-    return get_global_manager().get_text(rsc, fallback=fallback, default=default, encoding=encoding, errors=errors)
+    return _GET_TEXT(rsc, fallback=fallback, default=default, encoding=encoding, errors=errors)
+
+
+def preload(resources=None, max_workers=None):
+    """Read the binary data for many resources at once using a thread pool.
+
+    Args:
+        resources (list)[None]: Alias names, package paths, or Resource objects. If None use all resources.
+        max_workers (int)[None]: Number of threads to read with. If None use the ThreadPoolExecutor default.
+
+    Returns:
+        resources (list): List of Resource objects that were read.
+    """
+    return get_global_manager().preload(resources=resources, max_workers=max_workers)
+
+
+def mount(filename=RMAN_FILENAME):
+    """Read resource data from a file created with create_rman instead of the package files.
+
+    Args:
+        filename (str)['resources.rman']: Resource file. If not found the executable path is checked.
+
+    Returns:
+        success (bool): True if the file was mounted. If False resources are read from the packages.
+    """
+    return get_global_manager().mount(filename)
+
+
+def unmount():
+    """Close the mounted resource file and read resources from the packages."""
+    return get_global_manager().unmount()
+
+
+def create_rman(filename=RMAN_FILENAME, resource_manager=None):
+    """Save the registered file resources into one file that can be mounted.
+
+    Example:
+        .. code-block:: python
+
+            >>> # Build script. Add "resources.rman" to the executable datas.
+            >>> import mylib  # Register resources
+            >>> resource_man.create_rman('resources.rman')
+            >>>
+            >>> # Application. Reads use the mounted file if it exists.
+            >>> resource_man.mount('resources.rman')
+
+    Args:
+        filename (str)['resources.rman']: Filename to save the resources to.
+        resource_manager (ResourceManager)[None]: Resource manger to use. If None use default global ResourceManager.
+
+    Returns:
+        filename (str): Absolute path of the filename that was written.
+    """
+    if resource_manager is None:
+        resource_manager = get_global_manager()
+
+    toc = {}
+    datas = []
+    offset = 0
+    for resource in resource_manager.get_resources():
+        package_path = resource.package_path
+        if resource.data is not None or package_path in toc:
+            continue  # Plain data resources are registered in code
+
+        try:
+            data = resource.read_bytes()
+        except (ResourceNotAvailable, OSError, Exception):
+            continue
+        toc[package_path] = [offset, len(data)]
+        datas.append(data)
+        offset += len(data)
+
+    header = json.dumps(toc).encode('utf-8')
+    with open(filename, 'wb') as f:
+        f.write(RMAN_MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+        for data in datas:
+            f.write(data)
+
+    return os.path.abspath(filename)
 
 
 def registered_datas(resource_manager=None, use_dest_dirs=True,
@@ -793,17 +1671,29 @@ def registered_datas(resource_manager=None, use_dest_dirs=True,
         resource_manager = get_global_manager()
 
     datas = []
+    seen = set()
 
-    for man in [resource_manager] + resource_manager.managers:
+    # get_resources already includes the linked managers. Only add them when include_managers is False.
+    managers = [resource_manager]
+    if not include_managers:
+        managers.extend(resource_manager.managers)
+
+    for man in managers:
         for resource in man.get_resources(include_managers=include_managers,
                                           allow_duplicates=allow_duplicates, rsc_list=rsc_list):
-            if resource.is_resource():
-                with resource.as_file() as rsc_file:
-                    package_path = str(resource.package_path)
-                    if use_dest_dirs:
-                        package_path = os.path.dirname(package_path)
-                    data = (os.path.relpath(str(rsc_file)), package_path)
-                    if data not in datas:
-                        datas.append(data)
+            # Use one Traversable for the file check and the file path instead of is_resource() and as_file()
+            try:
+                path = resource.files()
+                if not path.is_file():
+                    continue
+            except READ_ERRORS:
+                continue  # Data resources with fake packages do not have a file
+
+            with as_file(path) as rsc_file:
+                package_path = resource.package_dir if use_dest_dirs else str(resource.package_path)
+                data = (os.path.relpath(str(rsc_file)), package_path)
+                if data not in seen:
+                    seen.add(data)
+                    datas.append(data)
 
     return datas
@@ -1,6 +1,7 @@
 import os
 import types
 import contextlib
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from importlib.machinery import SOURCE_SUFFIXES
@@ -11,53 +12,114 @@ from resource_man.__meta__ import version as __version__
 from resource_man.importlib_interface import \
     READ_API, FILES_API, Traversable, contents, is_resource, read_binary, read_text, files, as_file
 from resource_man.interface import \
-    ResourceNotAvailable, Resource, ResourceManagerInterface, ResourceManager, \
+    ResourceNotAvailable, Resource, ResourceManagerInterface, ResourceManager, MountedResources, \
     get_global_manager, set_global_manager, temp_manager, add_manager, remove_manager, clear, \
     register_resource, register, register_data, register_directory, unregister, has_resource, \
-    get_resources, get_resource, get_binary, get_text, registered_datas, \
+    get_resources, get_resource, get_binary, get_text, preload, registered_datas, \
+    create_rman, mount, unmount, RMAN_FILENAME, RESOURCE_TABLE_MODULE, \
     MISSING
+from resource_man.interface import _files_cached, _lookup_cache
 
 
 __all__ = [
-    'find_datas', 'EXCLUDE_EXT', 'SOURCE_SUFFIXES',
+    'find_datas', 'create_resource_table', 'EXCLUDE_EXT', 'SOURCE_SUFFIXES', 'RESOURCE_TABLE_FILENAME',
 
     'READ_API', 'FILES_API', 'Traversable', 'contents', 'is_resource', 'read_binary', 'read_text', 'files', 'as_file',
 
-    'ResourceNotAvailable', 'Resource', 'ResourceManagerInterface', 'ResourceManager',
+    'ResourceNotAvailable', 'Resource', 'ResourceManagerInterface', 'ResourceManager', 'MountedResources',
     'get_global_manager', 'set_global_manager', 'temp_manager', 'add_manager', 'remove_manager',
     'clear', 'register_resource', 'register', 'register_data', 'register_directory', 'unregister',
-    'has_resource', 'get_resources', 'get_resource', 'get_binary', 'get_text', 'registered_datas',
+    'has_resource', 'get_resources', 'get_resource', 'get_binary', 'get_text', 'preload', 'registered_datas',
+    'create_rman', 'mount', 'unmount', 'RMAN_FILENAME', 'RESOURCE_TABLE_MODULE',
     'MISSING',
     '__version__'
     ]
 
 
 EXCLUDE_EXT = SOURCE_SUFFIXES + ['.pyc', '.pyd']
-
-
-def find_datas(package, exclude_ext=None, use_dest_dirs=True, **kwargs):
+RESOURCE_TABLE_FILENAME = RESOURCE_TABLE_MODULE + '.py'  # Relative to the build directory
+
+
+@_lookup_cache
+def _resolve_toplvl(package):
+    """Return the top level package Traversable and file name, so repeated find_datas calls resolve it once."""
+    toplvl = _files_cached(package)
+    with as_file(toplvl) as n:
+        toplvl_filename = str(n)  # n should be a Path object, but I noticed it was a str anyway
+    return toplvl, toplvl_filename
+
+
+def _scan_directory(directory):
+    """Return the sub directory paths and file names using the file types cached by os.scandir."""
+    dirs = []
+    filenames = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if entry.name != '__pycache__':
+                        dirs.append(entry.path)
+                else:
+                    filenames.append(entry.name)
+    except OSError:
+        pass
+    return dirs, filenames
+
+
+def find_datas(package, exclude_ext=None, use_dest_dirs=True, max_workers=None, **kwargs):
     """Collect data files for pyinstaller.
 
     Args:
         package (types.ModuleType/str/Traversable): Top level package module or module name.
         exclude_ext (list)[None]: List of extensions to not include in the pyinstaller data.
         use_dest_dirs (bool)[True]: If True the destination will be a directory. If False the dest will be the filename.
+        max_workers (int)[None]: Number of threads used to scan the directories of each level.
 
     Returns:
         datas (list): List of (abs file path, rel install path). This will also include subdirectories.
     """
     if exclude_ext is None:
         exclude_ext = EXCLUDE_EXT
+    exclude_ext = frozenset(exclude_ext)
 
     datas = []
+    seen = set()
     pkg_name = package
     if isinstance(package, types.ModuleType):
         pkg_name = package.__package__
 
     with contextlib.suppress(ImportError, Exception):
-        toplvl = files(package)
-        with as_file(toplvl) as n:
-            toplvl_filename = str(n)  # n should be a Path object, but I noticed it was a str anyway
+        toplvl, toplvl_filename = _resolve_toplvl(package)
+
+        if os.path.isdir(toplvl_filename):
+            # Loose files on the file system. Scan the directories instead of entering "as_file" for every file.
+            # Each level of directories is scanned in parallel, which helps on slow network file systems.
+            top = os.path.realpath(toplvl_filename)
+            prefix_len = len(os.path.join(top, ''))  # Scanned paths start with the top directory
+            level = [top]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while level:
+                    next_level = []
+                    for root, (dirs, filenames) in zip(level, executor.map(_scan_directory, level)):
+                        next_level.extend(dirs)
+                        dest_dir = os.path.join(pkg_name, root[prefix_len:]) if root != top else pkg_name
+                        for name in filenames:
+                            if os.path.splitext(name)[-1] in exclude_ext:
+                                continue
+
+                            if use_dest_dirs:
+                                relpath = dest_dir
+                            else:
+                                relpath = os.path.join(dest_dir, name)
+
+                            data = (os.path.join(root, name), relpath)
+                            if data not in seen:
+                                seen.add(data)
+                                datas.append(data)
+                    level = next_level
+            return datas
+
+        # Zip or egg packages. Use the Traversable
         subdirs = [toplvl]
         while True:
             try:
@@ -85,7 +147,41 @@ def find_datas(package, exclude_ext=None, use_dest_dirs=True, **kwargs):
                             relpath = os.path.dirname(relpath)
 
                         data = (filename, relpath)
-                        if data not in datas:
+                        if data not in seen:
+                            seen.add(data)
                             datas.append(data)
 
     return datas
+
+
+def create_resource_table(filename=RESOURCE_TABLE_FILENAME, resource_manager=None):
+    """Write the RESOURCE_TABLE_MODULE module for a frozen executable.
+
+    The module maps (package, name) to the relative install path of every registered file resource. When the
+    executable is frozen and the module exists Resource.read_bytes opens the file from the executable path directly.
+
+    Note:
+        The default filename is relative to the current (build) directory, so the installed package is never
+        modified. Add the file's directory to the PyInstaller pathex, RESOURCE_TABLE_MODULE to hiddenimports and
+        the registered_datas() to datas.
+
+    Args:
+        filename (str)[RESOURCE_TABLE_FILENAME]: Python filename to write. Relative paths use the build directory.
+        resource_manager (ResourceManager)[None]: Resource manger to use. If None use default global ResourceManager.
+
+    Returns:
+        filename (str): Absolute path of the filename that was written.
+    """
+    if resource_manager is None:
+        resource_manager = get_global_manager()
+
+    lines = ['# Generated by resource_man.pyinstaller.create_resource_table', 'TABLE = {']
+    for resource in resource_manager.get_resources():
+        if resource.is_resource():
+            lines.append('    {!r}: {!r},'.format((resource.package, resource.name), resource.package_path))
+    lines.append('    }')
+
+    with open(filename, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+    return os.path.abspath(filename)
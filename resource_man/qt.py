@@ -1,18 +1,21 @@
+import io
 import os
 import sys
 import argparse
+import functools
 from pathlib import Path
 import importlib
-from contextlib import contextmanager
-from collections import OrderedDict
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
+from collections import OrderedDict, defaultdict
 from dynamicmethod import dynamicmethod
-from qtpy import API_NAME, QtCore, QtGui, QtSvg
+from qtpy import API_NAME, QtCore, QtGui
 
 
 try:
-    from subprocess import run
+    from subprocess import run, DEVNULL
 except (ImportError, Exception):
     from subprocess import Popen
+    DEVNULL = open(os.devnull, 'wb')
 
     def run(*args, check=False, **kwargs):
         proc = Popen(*args, **kwargs)
@@ -25,37 +28,42 @@ from resource_man.__meta__ import version as __version__
 from resource_man.importlib_interface import \
     READ_API, FILES_API, Traversable, contents, is_resource, read_binary, read_text, files, as_file
 from resource_man.interface import \
-    ResourceNotAvailable, Resource, ResourceManagerInterface, ResourceManager, \
+    ResourceNotAvailable, Resource, ResourceManagerInterface, ResourceManager, MountedResources, \
     get_global_manager, set_global_manager, temp_manager, add_manager, remove_manager, \
     clear, register_resource, register, register_data, register_directory, unregister, has_resource, \
-    get_resources, get_resource, get_binary, get_text, registered_datas, \
+    get_resources, get_resource, get_binary, get_text, preload, registered_datas, \
+    create_rman, mount, unmount, RMAN_FILENAME, \
     MISSING
+from resource_man import interface as _interface
 
 
 is_py2 = sys.version_info < (3, 0)
 
-# Qt rcc compiler path
-QT_RCC_BIN = files(API_NAME).joinpath('rcc.exe')
-if not QT_RCC_BIN.exists():
-    QT_RCC_BIN = files(API_NAME).joinpath(API_NAME.lower() + '-rcc.exe')
-try:
+
+@functools.lru_cache(maxsize=1)
+def _qt_rcc_bin():
+    """Return the Qt rcc compiler path. The Qt package is only searched the first time the path is needed."""
     if 'PyQt' in API_NAME:
         # pyrcc5 binary
-        QT_RCC_BIN = 'pyrcc' + ''.join(c for c in API_NAME if c.isdigit())
-except (ValueError, Exception):
-    pass
+        return 'pyrcc' + ''.join(c for c in API_NAME if c.isdigit())
+
+    rcc_bin = files(API_NAME).joinpath('rcc.exe')
+    if not rcc_bin.exists():
+        rcc_bin = files(API_NAME).joinpath(API_NAME.lower() + '-rcc.exe')
+    return rcc_bin
 
 
 __all__ = [
     'QFile', 'QPixmap', 'QIcon', 'QSvgWidget', 'create_qrc', 'compile_qrc', 'create_compiled', 'load_resource',
-    'compiled_py_to_qtpy',
+    'compiled_py_to_qtpy', 'clear_icon_cache', 'get_cached_icon', 'get_cached_pixmap',
 
     'READ_API', 'FILES_API', 'Traversable', 'contents', 'is_resource', 'read_binary', 'read_text', 'files', 'as_file',
 
-    'ResourceNotAvailable', 'Resource', 'ResourceManagerInterface', 'ResourceManager',
+    'ResourceNotAvailable', 'Resource', 'ResourceManagerInterface', 'ResourceManager', 'MountedResources',
     'get_global_manager', 'set_global_manager', 'temp_manager', 'add_manager', 'remove_manager',
     'clear', 'register_resource', 'register', 'register_data', 'register_directory', 'unregister',
-    'has_resource', 'get_resources', 'get_resource', 'get_binary', 'get_text', 'registered_datas',
+    'has_resource', 'get_resources', 'get_resource', 'get_binary', 'get_text', 'preload', 'registered_datas',
+    'create_rman', 'mount', 'unmount', 'RMAN_FILENAME',
     'MISSING',
     '__version__'
     ]
@@ -68,17 +76,32 @@ class _ResourceExt(Resource):
         This is not a part of the standard api and should not be used.
         """
         prefix = getattr(getattr(self, 'manager', None), 'prefix', None)
+        alias = self._alias
+
+        # Cache the name until the manager prefix or the alias changes
+        cached = self.__dict__.get('_qt_name_cache', None)
+        if cached is not None and cached[0] == prefix and cached[1] == alias:
+            return cached[2]
+
         if prefix:
-            return ':/{prefix}/{alias}'.format(prefix=prefix, alias=self.alias)
-        return ':/' + self.alias
+            qt_name = ':/{prefix}/{alias}'.format(prefix=prefix, alias=alias)
+        else:
+            qt_name = ':/' + alias
+        self.__dict__['_qt_name_cache'] = (prefix, alias, qt_name)
+        return qt_name
 
     orig_eq = Resource.orig_eq = Resource.__eq__  # NEED Resource.orig_eq to be set as well.
 
     def __eq__(self, other):
         if isinstance(other, str):
-            return other == self.qt_name or \
-                   other == self.alias or \
-                   other.replace('\\', '/') == self.package_path
+            # Cheapest checks first. The qt_name is built from the manager prefix, so only build it for ":/" names.
+            if other == self._alias:
+                return True
+            elif other.startswith(':/'):
+                return other == self.qt_name
+            elif '\\' in other:
+                other = other.replace('\\', '/')
+            return other == self._package_path
         return self.orig_eq(other)
 
 
@@ -91,6 +114,147 @@ QtCore_QFile = QtCore.QFile
 QtGui_QIcon = QtGui.QIcon
 QtGui_QPixmap = QtGui.QPixmap
 
+# Argument types the QFile, QPixmap, QIcon, and QSvgWidget constructors load through resource_man
+_RESOURCE_LIKE = (Resource, str, bytes, Traversable, Path)
+
+# Decoded pixmaps by ('resource', Resource) or ('name', str). QPixmap data is implicitly shared.
+PIXMAP_CACHE = OrderedDict()
+PIXMAP_CACHE_SIZE = 256
+
+# Shared valid QIcon objects from get_cached_icon by (name key, fallback key)
+ICON_CACHE = OrderedDict()
+ICON_CACHE_SIZE = 256
+
+
+# Registered resource name lookups for QFile.setFileName by name -> (Resource, filename)
+RESOLVE_CACHE = {}
+# Found get_file file names by ('resource', Resource, extension) or ('name', str, extension) -> filename
+FILE_CACHE = OrderedDict()
+FILE_CACHE_SIZE = 1024
+_RESOLVE_GENERATION = None
+
+
+def _get_resolve_cache():
+    """Return the name lookup cache. The caches are cleared when the registered resources change."""
+    global _RESOLVE_GENERATION
+    if _RESOLVE_GENERATION != _interface._REGISTRY_GENERATION:
+        RESOLVE_CACHE.clear()
+        FILE_CACHE.clear()
+        PIXMAP_CACHE.clear()
+        ICON_CACHE.clear()
+        _RESOLVE_GENERATION = _interface._REGISTRY_GENERATION
+    return RESOLVE_CACHE
+
+
+def _lru_get(cache, key):
+    """Return the cached value or None and mark the key as recently used."""
+    value = cache.get(key, None)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_set(cache, key, value, maxsize):
+    """Store the value and remove the least recently used items over the maxsize."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+def _get_file_cache():
+    """Return the get_file cache. The cache is cleared when the registered resources change."""
+    _get_resolve_cache()
+    return FILE_CACHE
+
+
+def _read_data(name, extension=None):
+    """Return the file bytes for the name or None if the file was not found or does not have the extension.
+
+    Resources are read directly. A QFile is only created to find the filename, Qt file, or registered resource.
+    """
+    if isinstance(name, Resource):
+        if extension is not None and name.ext_lower != extension:
+            return None
+        try:
+            return name.read_bytes()
+        except (ResourceNotAvailable, TypeError, ValueError, OSError, ImportError, Exception):
+            pass  # The resource may only exist in a compiled Qt resource file
+
+    # Try to find filename, Qt File, or importlib.resources read resource bytes.
+    file = QFile(name)
+    if not file.exists() or (extension is not None and file.ext_lower() != extension):
+        return None
+    try:
+        return file.read_bytes()
+    except (ResourceNotAvailable, TypeError, ValueError, OSError, ImportError, Exception):
+        return None
+
+
+def _cache_key(name):
+    """Return the cache key for a Resource or string name. Other values are not cached and return None.
+
+    The type is part of the key, because a Resource compares equal to its alias string.
+    """
+    if isinstance(name, Resource):
+        return ('resource', name)
+    elif isinstance(name, str):
+        return ('name', name)
+    return None
+
+
+def _load_pixmap(name):
+    """Return the decoded QPixmap for the name or None if the file was not found.
+
+    Resources and string names are only resolved, read, and decoded once while the registered resources do not
+    change. Bytes, Traversables, and pixmaps that could not be decoded are not cached.
+    """
+    key = _cache_key(name)
+    if key is not None:
+        _get_resolve_cache()  # Clear the pixmaps when the registered resources changed
+        pixmap = _lru_get(PIXMAP_CACHE, key)
+        if pixmap is not None:
+            return pixmap
+
+    data = _read_data(name)
+    if data is None:
+        return None
+    pixmap = QtGui_QPixmap()
+    pixmap.loadFromData(data)
+    if key is not None and not pixmap.isNull():
+        _lru_set(PIXMAP_CACHE, key, pixmap, PIXMAP_CACHE_SIZE)
+    return pixmap
+
+
+def _is_theme_name(name):
+    """Return if the name could be an icon theme name. Qt resource names and file paths skip the theme lookup."""
+    return not name.startswith(':') and '/' not in name and '\\' not in name
+
+
+def _is_qt_file(name):
+    """Return if the name is a Qt resource name or file path that exists, so Qt can load it without resource_man."""
+    return type(name) is str and (name.startswith(':') or '/' in name or '\\' in name) and _file_exists(name)
+
+
+@functools.lru_cache(maxsize=512)
+def _has_theme_icon(name):
+    """Return if the icon theme has the name. Qt searches the icon theme index for every lookup."""
+    return QtGui_QIcon.hasThemeIcon(name)
+
+
+def clear_icon_cache():
+    """Clear the decoded pixmaps. Use this after changing registered resources or the icon theme."""
+    PIXMAP_CACHE.clear()
+    ICON_CACHE.clear()
+    _has_theme_icon.cache_clear()
+
+
+def _file_exists(name):
+    """Return if the Qt resource (":/" name) or file exists without creating a QFile object."""
+    if name.startswith(':'):
+        return QtCore.QResource(name).isValid()
+    return os.path.exists(name)
+
 
 def get_file(name, return_bytes=True, extension=None):
     """Return the Qt file name or binary data from the file.
@@ -107,12 +271,28 @@ def get_file(name, return_bytes=True, extension=None):
             If unable to find the filename and return_bytes is False return the Traversable (Path) object.
             If not found or the filename does not have the proper extension return ''.
     """
+    if isinstance(name, Resource):
+        key = ('resource', name, extension)
+    elif isinstance(name, str):
+        key = ('name', name, extension)
+    else:
+        key = None
+
+    if key is not None:
+        filename = _lru_get(_get_file_cache(), key)
+        if filename is not None:
+            # Files on the file system can be removed or the working directory can change. Check the file again.
+            if filename.startswith(':') or _file_exists(filename):
+                return filename
+            FILE_CACHE.pop(key, None)
+
     file = QFile(name)
     if extension is not None and file.extension() != extension:
         return None
     filename = file.fileName()
     if filename is not None:
-
+        if key is not None:
+            _lru_set(FILE_CACHE, key, filename, FILE_CACHE_SIZE)
         return filename
     elif return_bytes:
         return file.read_bytes()
@@ -133,21 +313,22 @@ class QFile(QtCore_QFile):
         return obj
 
     def __init__(self, name=None, parent=None):
-        super().__init__()
+        if isinstance(name, QtCore.QObject) and not isinstance(name, QtCore_QFile):
+            parent = name
+            name = None
+
+        # The Qt object is only constructed here. __new__ already set the default attributes.
+        super().__init__(parent)
 
         if isinstance(name, QFile):  # This class
-            self._byts = getattr(self, '_byts', None)
-            self._filename = getattr(self, '_filename', None)
-            self._resource = getattr(self, '_resource', None)
-            self.given_name = getattr(self, 'given_name', None)
-        elif isinstance(name, (bytes, str, Resource, Traversable, Path)):
+            self._byts = name._byts
+            self._filename = name._filename
+            self._resource = name._resource
+            self.given_name = name.given_name
+            super(QFile, self).setFileName('None' if self._filename is None else self._filename)
+        elif type(name) is str or isinstance(name, _RESOURCE_LIKE):
             self.setFileName(name)
 
-        # name = self.given_name
-        # byts = self._byts
-        # filename = self._filename
-        # resource = self._resource
-
     # ===== QFile methods =====
     @dynamicmethod
     def exists(self, name=None):
@@ -155,11 +336,15 @@ class QFile(QtCore_QFile):
             if self._byts:
                 return True
 
-            has_resource = self._resource and (QtCore_QFile.exists(self._resource.qt_name) or
+            has_resource = self._resource and (_file_exists(self._resource.qt_name) or
                                                self._resource.is_resource())
-            has_filename = self._filename and QtCore_QFile.exists(self._filename)
-            return has_resource or has_filename or \
-                   QtCore_QFile.exists(QtCore_QFile.fileName(self))  # super() will crash. Check the filename
+            has_filename = self._filename and _file_exists(self._filename)
+            if has_resource or has_filename or \
+                    QtCore_QFile.exists(QtCore_QFile.fileName(self)):  # super() will crash. Check the filename
+                return True
+
+            # Data and mounted resources do not have a file. Check if the bytes can be read.
+            return bool(self.byts)
         return type(self)(name).exists()
 
     def basename(self):
@@ -173,8 +358,18 @@ class QFile(QtCore_QFile):
 
     def extension(self):
         """Return the extension of the resource name or filename."""
-        ext = os.path.splitext(self.basename())[-1]
-        return ext
+        if self._resource is not None:
+            return os.path.splitext(self._resource.name)[-1]
+        try:
+            return os.path.splitext(self._filename)[-1]
+        except (TypeError, ValueError):
+            return ''
+
+    def ext_lower(self):
+        """Return the lower case extension of the resource name or filename."""
+        if self._resource is not None:
+            return self._resource.ext_lower
+        return self.extension().lower()
 
     def fileName(self):
         return self._filename
@@ -188,7 +383,6 @@ class QFile(QtCore_QFile):
         elif isinstance(name, Resource):
             self._resource = name
             self._filename = str(self._resource)
-            self._byts = self._resource.read_bytes()
         elif isinstance(name, Traversable):
             self._byts = name.read_bytes()
         else:
@@ -196,29 +390,27 @@ class QFile(QtCore_QFile):
             str_name = str(name)
 
             # Try to create the icon from the registered resource name
-            try:
-                self._resource = get_resource(str_name)
-                if self._filename is None:
-                    if QtCore_QFile.exists(self._resource.alias):
-                        self._filename = self._resource.alias
-                    elif QtCore_QFile.exists(self._resource.qt_name):
-                        self._filename = self._resource.qt_name
-
-                    # Try reading the binary data
-                    self._byts = self._resource.read_bytes()
-            except (ResourceNotAvailable, TypeError, ValueError, OSError, ImportError, Exception):
-                pass
+            resolve_cache = _get_resolve_cache()
+            cached = resolve_cache.get(str_name, None)
+            if cached is not None:
+                self._resource, self._filename = cached
+            else:
+                resource = get_resource(str_name, default=None)
+                if resource is not None:
+                    self._resource = resource
+                    if _file_exists(resource.alias):
+                        self._filename = resource.alias
+                    elif _file_exists(resource.qt_name):
+                        self._filename = resource.qt_name
+                    resolve_cache[str_name] = (resource, self._filename)
 
             # Try to find the filename from the qt_name
-            try:
-                if self._filename is None:
-                    qt_name = ':/' + str_name
-                    if QtCore_QFile.exists(str_name):
-                        self._filename = str_name
-                    elif QtCore_QFile.exists(qt_name):
-                        self._filename = qt_name
-            except (ResourceNotAvailable, TypeError, ValueError, Exception):
-                pass
+            if self._filename is None:
+                qt_name = ':/' + str_name
+                if _file_exists(str_name):
+                    self._filename = str_name
+                elif _file_exists(qt_name):
+                    self._filename = qt_name
 
         if self._filename is None:
             return super(QFile, self).setFileName('None')
@@ -232,6 +424,20 @@ class QFile(QtCore_QFile):
         return ret
 
     # ===== QBuffer methods =====
+    @property
+    def byts(self):
+        """Return the binary data. The resource is only read when the data is first needed."""
+        if self._byts is None and self._resource is not None:
+            try:
+                self._byts = self._resource.read_bytes()
+            except (ResourceNotAvailable, TypeError, ValueError, OSError, ImportError, Exception):
+                pass
+        return self._byts
+
+    @byts.setter
+    def byts(self, value):
+        self._byts = value
+
     def data(self):
         if self.byts is not None:
             return QtCore.QByteArray(self.byts)
@@ -249,45 +455,37 @@ class QFile(QtCore_QFile):
     @property
     def package(self):
         """Return the resource package."""
-        try:
-            return self._resource.package
-        except (AttributeError, Exception):
-            return None
+        resource = self._resource
+        return resource.package if resource is not None else None
 
     @property
     def name(self):
         """Return the resource name."""
-        try:
-            return self._resource.name
-        except (AttributeError, Exception):
-            return None
+        resource = self._resource
+        return resource.name if resource is not None else None
 
     @property
     def package_path(self):
         """Return the package and name path of the resource."""
-        try:
-            return self._resource.package_path
-        except (AttributeError, Exception):
-            return ''
+        resource = self._resource
+        return resource.package_path if resource is not None else ''
 
     @property
     def alias(self):
         """Return the alias name identifier."""
-        try:
-            return self._resource.alias
-        except (AttributeError, Exception):
-            return self.fileName()
+        resource = self._resource
+        return resource.alias if resource is not None else self.fileName()
 
     # Backwards compatibility support
     identifier = alias
 
     def is_resource(self):
-        try:
-            return self._resource.is_resource()
-        except (AttributeError, Exception):
-            return False
+        resource = self._resource
+        return resource is not None and resource.is_resource()
 
     def files(self):
+        if self._resource is None:
+            raise ResourceNotAvailable('Invalid resource!')
         return self._resource.files()
 
     @contextmanager
@@ -296,6 +494,8 @@ class QFile(QtCore_QFile):
             yield file
 
     def contents(self):
+        if self._resource is None:
+            raise ResourceNotAvailable('Invalid resource!')
         return self._resource.contents()
 
     def read_bytes(self):
@@ -304,8 +504,7 @@ class QFile(QtCore_QFile):
             self._byts = self._resource.read_bytes()
         elif self._byts is None and self._filename is not None:
             try:
-                with open(self._filename, 'rb') as f:
-                    self._byts = f.read()
+                self._byts = Path(self._filename).read_bytes()
             except OSError:
                 if self._filename.startswith(':/'):
                     if self.open(self.ReadOnly | self.Text):
@@ -328,18 +527,17 @@ class QPixmap(QtGui_QPixmap):
         return super(QPixmap, cls).__new__(cls)
 
     def __init__(self, *args, **kwargs):
-        load_data = None
-        if len(args) >= 1 and isinstance(args[0], (Resource, str, bytes, Traversable)):
-            # Try to find filename, Qt File, or importlib.resources read resource bytes.
-            file = QFile(args[0])
+        pixmap = None
+        if len(args) >= 1 and _is_qt_file(args[0]):
+            pass  # Qt loads existing files and Qt resources directly
+        elif len(args) >= 1 and (type(args[0]) is str or isinstance(args[0], _RESOURCE_LIKE)):
+            pixmap = _load_pixmap(args[0])
             args = ('',) + args[1:]
-            if file.exists():
-                load_data = file.read_bytes()
 
         super(QPixmap, self).__init__(*args, **kwargs)
 
-        if isinstance(load_data, bytes):
-            self.loadFromData(load_data)
+        if pixmap is not None:
+            self.swap(QtGui_QPixmap(pixmap))  # Swap with a shared copy, so the cached pixmap is not emptied
 
 
 class QIcon(QtGui_QIcon):
@@ -352,89 +550,170 @@ class QIcon(QtGui_QIcon):
     def __init__(self, *args, **kwargs):
         is_valid = False
         if len(args) >= 1:
-            if isinstance(args[0], str) and QIcon.hasThemeIcon(args[0]):
+            if _is_qt_file(args[0]):
+                is_valid = True  # Qt loads existing files and Qt resources directly
+            elif isinstance(args[0], str) and _is_theme_name(args[0]) and _has_theme_icon(args[0]):
                 args = (QtGui_QIcon.fromTheme(args[0]),) + args[1:]
                 is_valid = True
-            elif isinstance(args[0], (Resource, str, bytes, Traversable)):
-                # Try to find filename, Qt File, or importlib.resources read resource bytes.
-                file = QFile(args[0])
+            elif type(args[0]) is str or isinstance(args[0], _RESOURCE_LIKE):
+                pixmap = _load_pixmap(args[0])
                 args = ('',) + args[1:]
-                if file.exists():
-                    pixmap = QtGui_QPixmap()
-                    pixmap.loadFromData(file.read_bytes())
+                if pixmap is not None:
                     args = (pixmap, ) + args[1:]
                     is_valid = True
 
         super(QIcon, self).__init__(*args, **kwargs)
         self.is_valid = is_valid
 
+    @classmethod
+    def clear_cache(cls):
+        """Clear the decoded pixmaps. Use this after changing registered resources or the icon theme."""
+        clear_icon_cache()
+
     def isNull(self, *args, **kwargs):
         return not self.is_valid and super().isNull()
 
     @dynamicmethod
     def fromTheme(self, name, fallback=None):
-        icn = QIcon(name)
-        if not icn.is_valid and fallback is not None:
-            icn = QIcon(fallback)
+        shared = get_cached_icon(name, fallback)
 
         if isinstance(self, QIcon):
-            self.swap(icn)
+            self.swap(QtGui_QIcon(shared))  # Swap with a copy, so the shared icon is not emptied
+            self.is_valid = shared.is_valid
             return self
+
+        icn = QIcon(shared)  # QIcon data is implicitly shared. Modifying the copy does not change the shared icon
+        icn.is_valid = shared.is_valid
         return icn
 
 
-QtSvgWidgets = None
-if not hasattr(QtSvg, "QSvgWidget"):
-    try:
-        if API_NAME == 'PyQt6':
-            from PyQt6 import QtSvgWidgets
-        elif API_NAME == 'PyQt5':
-            from PyQt5 import QtSvgWidgets
-        elif API_NAME == 'PySide6':
-            from PySide6 import QtSvgWidgets
-        elif API_NAME == 'PySide2':
-            from PySide2 import QtSvgWidgets
-        ORIG_QSvgWidget = QtSvgWidgets.QSvgWidget
-    except (ImportError, Exception):
-        class ORIG_QSvgWidget:
-            def __new__(cls, *args, **kwargs):
-                raise EnvironmentError('Could not load the proper SVG Widget. '
-                                       'This version of Qt may not be supported')
+def get_cached_icon(name, fallback=None):
+    """Return a shared QIcon for the name or the fallback if the name was not found.
 
-else:
-    ORIG_QSvgWidget = QtSvg.QSvgWidget
+    The icon for a Resource or string name is only created once while the registered resources do not change.
+    Icons that were not found are not cached. Do not modify the returned icon, because every caller receives the same
+    object. Use QIcon(get_cached_icon(name)) for an icon that can be modified.
 
+    Args:
+        name (str/bytes/Traversable/Resource): Theme icon name, registered resource, or file name.
+        fallback (str/bytes/Traversable/Resource)[None]: Name to use if the icon for the name was not found.
 
-class QSvgWidget(ORIG_QSvgWidget):
-    """QSvgWidget with resource_man support."""
-    def __new__(cls, *args, **kwargs):
-        return super(QSvgWidget, cls).__new__(cls)
+    Returns:
+        icon (QIcon): Shared icon object.
+    """
+    name_key = _cache_key(name)
+    fallback_key = _cache_key(fallback) if fallback is not None else None
+    key = None
+    if name_key is not None and (fallback is None or fallback_key is not None):
+        key = (name_key, fallback_key)
+        _get_resolve_cache()  # Clear the icons when the registered resources changed
+        icn = _lru_get(ICON_CACHE, key)
+        if icn is not None:
+            return icn
 
-    def __init__(self, *args, **kwargs):
-        load_data = None
-        if len(args) >= 1 and isinstance(args[0], (Resource, str, bytes, Traversable)):
-            # Try to find filename, Qt File, or importlib.resources read resource bytes.
-            file = QFile(args[0])
-            args = ('',) + args[1:]
-            if file.exists() and file.extension().lower() == '.svg':
-                load_data = file.read_bytes()
+    icn = QIcon(name)
+    if not icn.is_valid and fallback is not None:
+        icn = QIcon(fallback)
+
+    if key is not None and icn.is_valid:
+        _lru_set(ICON_CACHE, key, icn, ICON_CACHE_SIZE)
+    return icn
+
+
+def get_cached_pixmap(name):
+    """Return a shared QPixmap for the name.
+
+    This returns the decoded pixmap that QPixmap and QIcon use from the pixmap cache. Do not modify the returned
+    pixmap, because every caller receives the same object. Use QPixmap(get_cached_pixmap(name)) for a pixmap that can
+    be modified.
+
+    Args:
+        name (str/bytes/Traversable/Resource): Registered resource or file name.
 
-        super(QSvgWidget, self).__init__(*args, **kwargs)
+    Returns:
+        pixmap (QtGui.QPixmap): Shared pixmap object. A null pixmap if the file was not found.
+    """
+    pixmap = _load_pixmap(name)
+    if pixmap is None:
+        return QtGui_QPixmap()
+    return pixmap
+
+
+def _create_svg_widget():
+    """Import QtSvg and create the QSvgWidget class. QtSvg is only imported when QSvgWidget is first used."""
+    global QtSvg, QtSvgWidgets, ORIG_QSvgWidget, QSvgWidget
+    from qtpy import QtSvg
+
+    QtSvgWidgets = None
+    if not hasattr(QtSvg, "QSvgWidget"):
+        try:
+            if API_NAME == 'PyQt6':
+                from PyQt6 import QtSvgWidgets
+            elif API_NAME == 'PyQt5':
+                from PyQt5 import QtSvgWidgets
+            elif API_NAME == 'PySide6':
+                from PySide6 import QtSvgWidgets
+            elif API_NAME == 'PySide2':
+                from PySide2 import QtSvgWidgets
+            ORIG_QSvgWidget = QtSvgWidgets.QSvgWidget
+        except (ImportError, Exception):
+            class ORIG_QSvgWidget:
+                def __new__(cls, *args, **kwargs):
+                    raise EnvironmentError('Could not load the proper SVG Widget. '
+                                           'This version of Qt may not be supported')
+
+    else:
+        ORIG_QSvgWidget = QtSvg.QSvgWidget
+
+    class QSvgWidget(ORIG_QSvgWidget):
+        """QSvgWidget with resource_man support."""
+        def __new__(cls, *args, **kwargs):
+            return super(QSvgWidget, cls).__new__(cls)
+
+        def __init__(self, *args, **kwargs):
+            load_data = None
+            if len(args) >= 1 and (type(args[0]) is str or isinstance(args[0], _RESOURCE_LIKE)):
+                load_data = _read_data(args[0], '.svg')
+                args = ('',) + args[1:]
+
+            super(QSvgWidget, self).__init__(*args, **kwargs)
+
+            if isinstance(load_data, bytes):
+                self.load(load_data)
+
+    QSvgWidget.__qualname__ = 'QSvgWidget'
+    return QSvgWidget
 
-        if isinstance(load_data, bytes):
-            self.load(load_data)
+
+def __getattr__(name):
+    """Lazily find the QT_RCC_BIN and import QtSvg for the QSvgWidget (PEP 562)."""
+    if name == 'QT_RCC_BIN':
+        return _qt_rcc_bin()
+    elif name in ('QSvgWidget', 'ORIG_QSvgWidget', 'QtSvg', 'QtSvgWidgets'):
+        _create_svg_widget()
+        return globals()[name]
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
 
 @contextmanager
 def context_file(file):
-    """Use as_file or just yield the given file."""
-    if isinstance(file, Traversable):
+    """Use as_file or just yield the given file. Paths on the file system are yielded without as_file."""
+    if isinstance(file, Traversable) and not isinstance(file, Path):
         with as_file(file) as fname:
             yield fname
     else:
         yield file
 
 
+def _scan_file_names(directory):
+    """Return the file names in the directory using the file types cached by os.scandir."""
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(entry.name for entry in it if entry.is_file())
+    except OSError:
+        return frozenset()
+
+
 def create_qrc(filename="resource_man_compiled_resources.qrc", prefix='', resource_manager=None, main_module=None):
     """Make a Qt RCC file.
 
@@ -460,7 +739,8 @@ def create_qrc(filename="resource_man_compiled_resources.qrc", prefix='', resour
         filename (str)['resource_man_compiled_resources.qrc']: Filename to create the .qrc file with.
         prefix (str)['']: qresource prefix.
         resource_manager (ResourceManager)[None]: Resource manger to use. If None use default global ResourceManager.
-        main_module (str)[None]: This module will be imported to register resources before creating the .qrc file.
+        main_module (str/list)[None]: Module or list of modules that will be imported to register resources before
+            creating the .qrc file.
 
     Returns:
         filename (str): Absolute path of the filename that was written.
@@ -468,63 +748,105 @@ def create_qrc(filename="resource_man_compiled_resources.qrc", prefix='', resour
     if resource_manager is None:
         resource_manager = get_global_manager()
 
-    # Import the main module that registers the resources
+    # Import the main modules that register the resources
     if isinstance(main_module, (str, Path)):
-        main_module = str(main_module)
-        if '/' in main_module or '\\' in main_module or '.' in main_module:
-            sys.path.append(os.path.dirname(main_module))
-            main_module = os.path.splitext(os.path.basename(main_module))[0]
-        importlib.import_module(main_module)
+        main_module = [main_module]
+    for module in (main_module or []):
+        module = str(module)
+        if '/' in module or '\\' in module or '.' in module:
+            sys.path.append(os.path.dirname(module))
+            module = os.path.splitext(os.path.basename(module))[0]
+        importlib.import_module(module)
 
     # Get all managers according to their prefix
-    managers = OrderedDict([(None, [])])
-    prefix = prefix or getattr(resource_manager, 'prefix', None) or None
-    try:
-        managers[prefix].append(resource_manager)
-    except (KeyError, AttributeError, Exception):
-        managers[prefix] = [resource_manager]
+    managers = defaultdict(list)
+    managers[None]  # Keep the default qresource first
+    managers[prefix or getattr(resource_manager, 'prefix', None) or None].append(resource_manager)
     for man in resource_manager.managers:
-        prefix = getattr(man, 'prefix', None) or None
+        managers[getattr(man, 'prefix', None) or None].append(man)
+
+    # Create the QRC File. Write each line instead of joining one large string
+    cwd = os.getcwd()  # os.path.relpath would look up the working directory for every file
+    dir_files = {}  # Directory -> file names
+    # Write a temporary file in the same directory and replace the target, so errors never leave a partial file.
+    # Exclusive create mode applies the process umask permissions and never opens an existing file.
+    filename = os.path.abspath(filename)
+    tmp = '{}.{}.tmp'.format(filename, os.urandom(8).hex())
+    file = open(tmp, "x", buffering=1 << 20)
+    try:
+        with file:
+            file.write('<!DOCTYPE RCC><RCC version="1.0">\n')
+
+            for prefix, mans in managers.items():
+                if prefix:
+                    file.write('<qresource prefix="{}">\n'.format(prefix))
+                else:
+                    file.write('<qresource>\n')
+
+                for man in mans:
+                    for resource in man.get_resources():
+                        try:
+                            rsc = resource.files()
+                            if not isinstance(rsc, Path) and not rsc.is_file():
+                                continue
+                        except _interface.READ_ERRORS:
+                            continue  # Data resources with fake packages do not have a file
+
+                        if isinstance(rsc, Path):
+                            # Read each directory once. Files on the file system are not extracted to a temporary file
+                            directory = os.fspath(rsc.parent)
+                            names = dir_files.get(directory, None)
+                            if names is None:
+                                names = dir_files[directory] = _scan_file_names(directory)
+                            if rsc.name not in names:
+                                continue
+                            path = os.path.relpath(os.fspath(rsc), cwd)
+                        else:
+                            with as_file(rsc) as rsc_file:
+                                path = os.path.relpath(str(rsc_file), cwd)
+                        file.write('\t<file alias="{}">{}</file>\n'.format(resource.alias, path))
+
+                file.write('</qresource>\n')
+
+            file.write('</RCC>\n')
+        os.replace(tmp, filename)
+    except BaseException:
         try:
-            managers[prefix].append(man)
-        except (KeyError, AttributeError, Exception):
-            managers[prefix] = [man]
-
-    # Create the QRC File
-    text = ['<!DOCTYPE RCC><RCC version="1.0">']
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
 
-    for prefix, mans in managers.items():
-        if prefix:
-            text.append('<qresource prefix="{}">'.format(prefix))
-        else:
-            text.append('<qresource>')
+    return filename
 
-        for man in mans:
-            for resource in man.get_resources():
-                if resource.is_resource():
-                    with resource.as_file() as rsc_file:
-                        path = os.path.relpath(str(rsc_file))
-                        text.append('\t<file alias="{}">{}</file>'.format(resource.alias, path))
 
-        text.append('</qresource>')
+def _run_pyrcc_main(filename, output, quiet=False):
+    """Run the PyQt5 resource compiler in this process. Return None if PyQt5.pyrcc_main is not available.
 
-    text.append('</RCC>')
+    If quiet is True the compiler messages written to sys.stdout and sys.stderr are discarded.
+    """
+    try:
+        from PyQt5.pyrcc_main import processResourceFile
+    except (ImportError, Exception):
+        return None
 
-    with open(filename, "w") as file:
-        file.write("\n".join(text))
+    if not quiet:
+        return bool(processResourceFile([filename], output, False))
 
-    return os.path.abspath(filename)
+    with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+        return bool(processResourceFile([filename], output, False))
 
 
-def compile_qrc(filename="resource_man_compiled_resources.qrc", output=None, rcc_bin=QT_RCC_BIN, use_qtpy=True):
+def compile_qrc(filename="resource_man_compiled_resources.qrc", output=None, rcc_bin=None, use_qtpy=True, quiet=False):
     """Create the python resource file from the .qrc file.
 
     Args:
         filename (str)['resource_man_compiled_resources.qrc']: QRC resrouce file.
         output (str)[None]: Name of the new python file that should be created.
             Default "resource_man_compiled_resources.py" or "resource_man_compiled_resources.rcc".
-        rcc_bin (Traversable/Path/str)[files(API_NAME).joinpath(rcc.exe)]: Path to the rcc binary.
+        rcc_bin (Traversable/Path/str)[None]: Path to the rcc binary. If None use QT_RCC_BIN.
         use_qtpy (bool)[True]: If True replace the Qt API with qtpy.
+        quiet (bool)[False]: If True discard the rcc output. Otherwise the rcc output goes to this process' output.
 
     Returns:
         filename (str): Python filename of the saved resource file.
@@ -532,6 +854,9 @@ def compile_qrc(filename="resource_man_compiled_resources.qrc", output=None, rcc
     if output is None:
         output = os.path.splitext(filename)[0] + ".py"  # or .py and "import app_resources.py"
 
+    if rcc_bin is None:
+        rcc_bin = _qt_rcc_bin()
+
     with context_file(rcc_bin) as rcc:
         rcc = str(rcc)
         args = [rcc, filename, '-o', output]
@@ -561,7 +886,15 @@ def compile_qrc(filename="resource_man_compiled_resources.qrc", output=None, rcc
             # .rcc binary file for PyQt is not supported
             args[3] = output = os.path.splitext(output)[0] + '.py'  # PyQT rcc does not support rcc binary
 
-        success = run(args, stdout=sys.stdout, stderr=sys.stderr).returncode == 0
+        success = None
+        if rcc == 'pyrcc5':
+            # The default pyrcc5 is a Python script. Compile in this process instead of starting an interpreter.
+            success = _run_pyrcc_main(filename, output, quiet=quiet)
+
+        if success is None:
+            # None inherits this process' output handles. No pipes are created.
+            out = DEVNULL if quiet else None
+            success = run(args, stdout=out, stderr=out).returncode == 0
         if success and is_py and use_qtpy:
             compiled_py_to_qtpy(output)
 
@@ -571,22 +904,31 @@ def compile_qrc(filename="resource_man_compiled_resources.qrc", output=None, rcc
 def compiled_py_to_qtpy(filename):
     """Modify the compiled .py file to use qtpy instead of PySide2 or PyQt5."""
     # Convert resources.py import of PySide2 or PyQt5 to qtpy
-    with open(filename, 'r+') as f:
-        lines = f.readlines()
-        f.seek(0, 0)
-        f.truncate()  # File size is not different must truncate
-
-        # Cannot use f.read().replace(API_NAME, 'qtpy') because we allow given rcc_bin
-        for i, line in enumerate(lines):
-            if ' import QtCore' in line:  # line is "from PySide2 import QtCore"
-                lines[i] = 'from qtpy import QtCore\n'  # Does not use Windows \r\n. Otherwise could use os.linesep
+    # Cannot use f.read().replace(API_NAME, 'qtpy') because we allow given rcc_bin
+    new_line = b'from qtpy import QtCore'
+    with open(filename, 'rb+') as f:
+        offset = 0
+        for line in iter(f.readline, b''):
+            if b' import QtCore' in line:  # line is "from PySide2 import QtCore"
+                if line.rstrip() == new_line:
+                    break  # Already converted. Do not write to the file
+                elif len(new_line) < len(line):
+                    # Pad with spaces to overwrite the line in place. Does not use Windows \r\n.
+                    f.seek(offset)
+                    f.write(new_line.ljust(len(line) - 1) + b'\n')
+                else:
+                    # Only the data after the import line is moved
+                    remainder = f.read()
+                    f.seek(offset)
+                    f.write(new_line + b'\n')
+                    f.write(remainder)
+                    f.truncate()  # File size is different must truncate
                 break
-
-        f.writelines(lines)
+            offset += len(line)
 
 
 def create_compiled(filename="resource_man_compiled_resources.qrc", prefix='', main_module=None, output=None,
-                    rcc_bin=QT_RCC_BIN, use_qtpy=True):
+                    rcc_bin=None, use_qtpy=True, quiet=False):
     """Make a Qt RCC .qrc file, compile the Qt RCC file to a .py or .rcc file, and remove the unneeded QRC file.
 
     Note:
@@ -612,26 +954,39 @@ def create_compiled(filename="resource_man_compiled_resources.qrc", prefix='', m
     Args:
         filename (str)['resource_man_compiled_resources.qrc']: Filename to create the .qrc file with.
         prefix (str)['']: qresource prefix.
-        main_module (str)[None]: This module will be imported to register resources before creating the .qrc file.
+        main_module (str/list)[None]: Module or list of modules that will be imported to register resources before
+            creating the .qrc file.
         output (str)[None]: Name of the new python file that should be created.
             Default "resource_man_compiled_resources.py" or "resource_man_compiled_resources.rcc".
-        rcc_bin (Traversable/Path/str)[files(API_NAME).joinpath(rcc.exe)]: Path to the rcc binary.
+        rcc_bin (Traversable/Path/str)[None]: Path to the rcc binary. If None use QT_RCC_BIN.
         use_qtpy (bool)[True]: If True replace the Qt API with qtpy.
+        quiet (bool)[False]: If True discard the rcc output.
 
     Returns:
         filename (str): Python filename of the saved resource file.
     """
     create_qrc(filename, prefix=prefix, main_module=main_module)
-    out = compile_qrc(filename, output=output, rcc_bin=rcc_bin, use_qtpy=use_qtpy)
+    out = compile_qrc(filename, output=output, rcc_bin=rcc_bin, use_qtpy=use_qtpy, quiet=quiet)
     os.remove(filename)
     return out
 
 
+# Successfully loaded resource files by absolute path
+LOADED_RESOURCES = {}
+
+
 def load_resource(filename='resource_man_compiled_resources.py'):
-    """Load a Qt resource file."""
+    """Load a Qt resource file. A file that was loaded successfully is not loaded again."""
+    key = os.path.abspath(str(filename))
+    if key in LOADED_RESOURCES:
+        return LOADED_RESOURCES[key]
+
+    _interface._registry_changed()  # Qt file names may exist now
     try:
         if filename == 'resource_man_compiled_resources.py':
-            import resource_man_compiled_resources
+            if 'resource_man_compiled_resources' not in sys.modules:
+                import resource_man_compiled_resources
+            LOADED_RESOURCES[key] = True
             return True
     except (ImportError, Exception):
         pass
@@ -641,7 +996,7 @@ def load_resource(filename='resource_man_compiled_resources.py'):
         with context_file(filename) as fname:
             fname = str(fname)
             if fname.endswith('.rcc'):
-                return QtCore.QResource.registerResource(fname)
+                loaded = QtCore.QResource.registerResource(fname)
             else:
                 directory = os.path.dirname(fname)
                 dir_added = directory not in sys.path  # Could convert to := later. Want to support backwards compatible
@@ -652,10 +1007,14 @@ def load_resource(filename='resource_man_compiled_resources.py'):
                 finally:
                     if dir_added:
                         sys.path.remove(directory)
-                return True
+                loaded = True
     except (ImportError, Exception):
         return False
 
+    if loaded:
+        LOADED_RESOURCES[key] = loaded
+    return loaded
+
 
 if __name__ == '__main__':
     P = argparse.ArgumentParser('Run a Qt resource helper.')
@@ -667,7 +1026,8 @@ if __name__ == '__main__':
     CREATE_QRC = SUBP.add_parser('create', help='Create the .qrc file.')
     CREATE_QRC.set_defaults(func=create_qrc)
     # Main module to import
-    CREATE_QRC.add_argument('main_module', type=str, help='Main module that is imported and registers resources.')
+    CREATE_QRC.add_argument('main_module', type=str, nargs='+',
+                            help='Main modules that are imported and register resources.')
     CREATE_QRC.add_argument('--filename', '-f', type=str, default='resource_man_compiled_resources.qrc')
     CREATE_QRC.add_argument('--prefix', '-p', type=str, default='')
 
@@ -676,19 +1036,22 @@ if __name__ == '__main__':
     COMPILE_QRC.set_defaults(func=compile_qrc)
     COMPILE_QRC.add_argument('--filename', '-f', type=str, default='resource_man_compiled_resources.qrc')
     COMPILE_QRC.add_argument('--output', '-o', type=str, default=None)
-    COMPILE_QRC.add_argument('--rcc_bin', type=str, default=QT_RCC_BIN)
+    COMPILE_QRC.add_argument('--rcc_bin', type=str, default=None)
     COMPILE_QRC.add_argument('--use_qtpy', '-q', type=bool, default=True, help='Convert compiled resources to qtpy.')
+    COMPILE_QRC.add_argument('--quiet', action='store_true', help='Discard the rcc output.')
 
     # Run both
     RUN_P = SUBP.add_parser('run', help='Create and compile the resources.')
     RUN_P.set_defaults(func=create_compiled)
     # Main module to import
-    RUN_P.add_argument('main_module', type=str, help='Main module that is imported and registers resources.')
+    RUN_P.add_argument('main_module', type=str, nargs='+',
+                       help='Main modules that are imported and register resources.')
     RUN_P.add_argument('--filename', '-f', type=str, default='resource_man_compiled_resources.qrc')
     RUN_P.add_argument('--prefix', '-p', type=str, default='')
     RUN_P.add_argument('--output', '-o', type=str, default=None)
-    RUN_P.add_argument('--rcc_bin', type=str, default=QT_RCC_BIN)
+    RUN_P.add_argument('--rcc_bin', type=str, default=None)
     RUN_P.add_argument('--use_qtpy', '-q', type=bool, default=True, help='Convert compiled resources to qtpy.')
+    RUN_P.add_argument('--quiet', action='store_true', help='Discard the rcc output.')
 
     # ===== Parse given command line arguments into keyword arguments =====
     ARGS, REMAIN = P.parse_known_args()
@@ -24,9 +24,58 @@ def test_registered_datas():
     assert (os.path.relpath(str(rsc.files())), rsc.package_path) in datas
     assert (os.path.relpath(str(rsc2.files())), rsc2.package_path) in datas
 
+    # Data resources with fake packages are skipped
+    from resource_man.pyinstaller import ResourceManager
+    man = ResourceManager()
+    man.register_data(b'data', 'fake_pkg', 'data.txt')
+    rsc3 = man.register('check_lib', 'rsc.txt', ...)
+    assert registered_datas(man) == [(os.path.relpath(str(rsc3.files())), rsc3.package_dir)]
+
+
+def test_create_resource_table():
+    import sys
+    import tempfile
+    import resource_man.interface as interface
+    from resource_man.pyinstaller import ResourceManager, create_resource_table, RESOURCE_TABLE_MODULE
+
+    man = ResourceManager()
+    rsc = man.register('check_lib', 'rsc.txt', ...)
+    man.register_data(b'data', 'fake_pkg', 'data.txt')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = create_resource_table(os.path.join(tmp, RESOURCE_TABLE_MODULE + '.py'), resource_manager=man)
+        namespace = {}
+        with open(filename) as f:
+            exec(f.read(), namespace)
+
+        # The table is only used by frozen executables
+        sys.path.insert(0, tmp)
+        try:
+            interface.RESOURCE_TABLE = None
+            assert interface._get_resource_table() == {}
+            sys.frozen = True
+            assert interface._get_resource_table() == namespace['TABLE']
+
+            # Table files are read without resolving the package path through importlib
+            table_file = os.path.join(tmp, 'table.txt')
+            with open(table_file, 'wb') as f:
+                f.write(b'table data')
+            interface.RESOURCE_TABLE = {('check_lib', 'rsc.txt'): table_file}
+            table_rsc = interface.Resource('check_lib', 'rsc.txt')
+            assert table_rsc.read_bytes() == b'table data'
+            assert table_rsc._cache_path is None
+        finally:
+            vars(sys).pop('frozen', None)
+            sys.path.remove(tmp)
+            sys.modules.pop(RESOURCE_TABLE_MODULE, None)
+            interface.RESOURCE_TABLE = None
+
+    assert namespace['TABLE'] == {('check_lib', 'rsc.txt'): rsc.package_path}
+
 
 if __name__ == '__main__':
     test_find_datas()
     test_registered_datas()
+    test_create_resource_table()
 
     print('All tests passed successfully!')
@@ -0,0 +1,227 @@
+import os
+import sys
+sys.path.append('test_lib')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+def get_app():
+    from qtpy import QtWidgets
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_pixmap_cache():
+    import resource_man.qt as rsc
+
+    app = get_app()
+    with rsc.temp_manager(rsc.ResourceManager()):
+        rsc.register('check_lib.check_sub', 'edit-cut.png', alias='pixmap-icon')
+        pixmap = rsc.QPixmap('pixmap-icon')
+        assert not pixmap.isNull()
+        assert ('name', 'pixmap-icon') in rsc.PIXMAP_CACHE
+        assert rsc.QPixmap('pixmap-icon').cacheKey() == pixmap.cacheKey()
+
+        # Unregistered resources are not loaded from the cache
+        rsc.unregister('pixmap-icon')
+        assert not rsc.has_resource('pixmap-icon')
+        assert rsc.QPixmap('pixmap-icon').isNull()
+        assert not rsc.QIcon('pixmap-icon').is_valid
+        assert ('name', 'pixmap-icon') not in rsc.PIXMAP_CACHE
+
+        # Registering the alias to a different file loads the new file
+        rsc.register('check_lib.check_sub', 'document-new.png', alias='pixmap-icon')
+        new_pixmap = rsc.QPixmap('pixmap-icon')
+        assert not new_pixmap.isNull()
+        assert new_pixmap.cacheKey() != pixmap.cacheKey()
+
+    # The previous global manager does not have the alias
+    assert rsc.QPixmap('pixmap-icon').isNull()
+
+    # The cache is bounded
+    old_size = rsc.PIXMAP_CACHE_SIZE
+    rsc.PIXMAP_CACHE_SIZE = 2
+    try:
+        with rsc.temp_manager(rsc.ResourceManager()):
+            for alias in ('lru-1', 'lru-2', 'lru-3'):
+                rsc.register('check_lib.check_sub', 'edit-cut.png', alias=alias)
+            for alias in ('lru-1', 'lru-2', 'lru-3'):
+                assert not rsc.QPixmap(alias).isNull()
+            assert list(rsc.PIXMAP_CACHE) == [('name', 'lru-2'), ('name', 'lru-3')]
+    finally:
+        rsc.PIXMAP_CACHE_SIZE = old_size
+    app.processEvents()
+
+
+def test_icon_cache():
+    import resource_man.qt as rsc
+
+    app = get_app()
+    with rsc.temp_manager(rsc.ResourceManager()):
+        # Missing icons and pixmaps are not cached
+        assert not rsc.QIcon.fromTheme('cached-icon').is_valid
+        assert rsc.get_cached_pixmap('cached-icon').isNull()
+        assert not rsc.ICON_CACHE
+
+        rsc.register('check_lib.check_sub', 'edit-cut.png', alias='cached-icon')
+        assert rsc.QIcon.fromTheme('cached-icon').is_valid
+        assert not rsc.QIcon.fromTheme('does-not-exist', 'cached-icon').isNull()
+        assert not rsc.get_cached_pixmap('cached-icon').isNull()
+
+        # Shared objects
+        icon = rsc.get_cached_icon('cached-icon')
+        assert icon is rsc.get_cached_icon('cached-icon')
+        assert rsc.QIcon.fromTheme('cached-icon') is not icon
+        assert rsc.get_cached_pixmap('cached-icon') is rsc.get_cached_pixmap('cached-icon')
+
+        # Instance form swaps the icon
+        swapped = rsc.QIcon()
+        swapped.fromTheme('does-not-exist', 'cached-icon')
+        assert swapped.is_valid and not swapped.isNull()
+        assert not icon.isNull()
+
+        # Unregistering clears the shared objects
+        rsc.unregister('cached-icon')
+        assert not rsc.QIcon.fromTheme('cached-icon').is_valid
+        assert rsc.get_cached_icon('cached-icon') is not icon
+        assert rsc.get_cached_pixmap('cached-icon').isNull()
+
+        rsc.register('check_lib.check_sub', 'edit-cut.png', alias='cached-icon')
+        assert rsc.get_cached_icon('cached-icon').is_valid
+        rsc.clear_icon_cache()
+        assert not rsc.ICON_CACHE and not rsc.PIXMAP_CACHE
+    app.processEvents()
+
+
+def test_get_file_cache():
+    import tempfile
+    import resource_man.qt as rsc
+
+    get_app()
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'file.txt')
+        with open(filename, 'wb') as f:
+            f.write(b'data')
+
+        assert rsc.get_file(filename) == filename
+        assert ('name', filename, None) in rsc.FILE_CACHE
+        assert rsc.get_file(filename) == filename
+
+        # Removed files are not returned from the cache
+        os.remove(filename)
+        assert rsc.get_file(filename, return_bytes=False) is None
+        assert ('name', filename, None) not in rsc.FILE_CACHE
+
+    # The cache is bounded
+    old_size = rsc.FILE_CACHE_SIZE
+    rsc.FILE_CACHE_SIZE = 2
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            names = []
+            for i in range(3):
+                names.append(os.path.join(tmp, 'file{}.txt'.format(i)))
+                open(names[-1], 'w').close()
+                assert rsc.get_file(names[-1]) == names[-1]
+            assert list(rsc.FILE_CACHE) == [('name', names[1], None), ('name', names[2], None)]
+    finally:
+        rsc.FILE_CACHE_SIZE = old_size
+
+
+def test_qfile_copy():
+    from qtpy import QtCore
+    import resource_man.qt as rsc
+
+    get_app()
+    with rsc.temp_manager(rsc.ResourceManager()):
+        resource = rsc.register('check_lib', 'rsc.txt', alias='copy-file')
+        file = rsc.QFile(resource)
+        copy = rsc.QFile(file)
+        assert copy.fileName() == file.fileName()
+        assert copy.open(QtCore.QIODevice.ReadOnly)
+        try:
+            assert bytes(copy.readAll()) == file.read_bytes()
+        finally:
+            copy.close()
+
+
+def test_removed_resource():
+    import shutil
+    import tempfile
+    import importlib
+    import resource_man.qt as rsc
+
+    get_app()
+    with tempfile.TemporaryDirectory() as tmp:
+        pkg = os.path.join(tmp, 'removed_rsc_pkg')
+        os.mkdir(pkg)
+        open(os.path.join(pkg, '__init__.py'), 'w').close()
+        filename = os.path.join(pkg, 'edit-cut.png')
+        shutil.copyfile(os.path.join('test_lib', 'check_lib', 'check_sub', 'edit-cut.png'), filename)
+
+        sys.path.insert(0, tmp)
+        try:
+            importlib.import_module('removed_rsc_pkg')
+            with rsc.temp_manager(rsc.ResourceManager()):
+                resource = rsc.register('removed_rsc_pkg', 'edit-cut.png', alias='removed-icon')
+                assert resource.is_resource()
+                assert rsc.QFile('removed-icon').exists()
+                assert not rsc.QPixmap('removed-icon').isNull()
+
+                # Removed files are not found and return null objects instead of raising an error
+                os.remove(filename)
+                rsc.clear_icon_cache()
+                assert not resource.is_resource()
+                assert not rsc.QFile('removed-icon').exists()
+                assert rsc.QPixmap('removed-icon').isNull()
+                assert not rsc.QIcon('removed-icon').is_valid
+        finally:
+            sys.path.remove(tmp)
+            sys.modules.pop('removed_rsc_pkg', None)
+
+
+def test_create_qrc_atomic():
+    import tempfile
+    import resource_man.qt as rsc
+
+    class BrokenManager(rsc.ResourceManager):
+        def get_resources(self):
+            raise RuntimeError('broken')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'resources.qrc')
+        with open(filename, 'w') as f:
+            f.write('old')
+
+        # Errors keep the previous file and do not leave a temporary file
+        try:
+            rsc.create_qrc(filename, resource_manager=BrokenManager())
+            raise AssertionError('create_qrc should raise the error')
+        except RuntimeError:
+            pass
+        with open(filename) as f:
+            assert f.read() == 'old'
+        assert os.listdir(tmp) == ['resources.qrc']
+
+        man = rsc.ResourceManager()
+        man.register('check_lib.check_sub', 'edit-cut.png', alias='edit-cut')
+        man.register_data(b'data', 'fake_pkg', 'data.txt', alias='fake-data')  # Data resources are skipped
+        assert rsc.create_qrc(filename, resource_manager=man) == filename
+        with open(filename) as f:
+            text = f.read()
+            assert 'alias="edit-cut"' in text
+            assert 'alias="fake-data"' not in text
+        assert os.listdir(tmp) == ['resources.qrc']
+
+        # The file has the same permissions as any new file
+        reference = os.path.join(tmp, 'reference.txt')
+        open(reference, 'w').close()
+        assert os.stat(filename).st_mode == os.stat(reference).st_mode
+
+
+if __name__ == '__main__':
+    test_pixmap_cache()
+    test_icon_cache()
+    test_get_file_cache()
+    test_qfile_copy()
+    test_removed_resource()
+    test_create_qrc_atomic()
+
+    print('All tests passed successfully!')
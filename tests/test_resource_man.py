@@ -161,6 +161,253 @@ def test_register():
     assert not rsc.has_resource('check_lib', 'rsc.txt')
 
 
+def test_manager_lookup():
+    import copy
+    import resource_man as rsc
+
+    man = rsc.ResourceManager()
+    first = man.register('check_lib', 'rsc.txt', alias='text')
+    second = man.register('check_lib.check_sub', 'rsc2.txt', alias='text')
+
+    # Last registered alias is used
+    assert man.get_resource('text') is second
+    assert man.get_resource('check_lib/rsc.txt') is first
+    assert man.get_resource('check_lib\\rsc.txt') is first
+    assert man.has_resource('check_lib.check_sub', 'rsc2.txt')
+
+    # Unregister falls back to the previous alias
+    man.unregister('text')
+    assert man.get_resource('text') is first
+    assert not man.has_resource('check_lib.check_sub', 'rsc2.txt')
+
+    # Changing the alias updates the lookup
+    first.alias = 'other'
+    assert man.get_resource('other') is first
+    assert not man.has_resource('text')
+
+    # Replace the resource for an alias
+    replacement = rsc.Resource('check_lib.check_sub', 'rsc2.txt', alias='other')
+    man['other'] = replacement
+    assert man.get_resource('other') is replacement
+    assert first not in man
+    man.unregister(replacement)
+    assert not man.has_resource('other')
+    man.register('check_lib', 'rsc.txt', alias='text')
+    man.unregister('check_lib\\rsc.txt')
+    assert not man.has_resource('check_lib/rsc.txt')
+
+    # Dict style lookup with linked managers
+    linked = rsc.ResourceManager()
+    edit_cut = linked.register('check_lib.check_sub', 'edit-cut.png', None)
+    man.add_manager(linked)
+    assert man.get('edit-cut') is edit_cut
+    assert man.get('does-not-exist') is None
+    assert man.get('does-not-exist', default=first) is first
+
+    # Copies do not share the lookup index
+    snapshot = copy.copy(man)
+    assert isinstance(snapshot, rsc.ResourceManager)
+    snapshot.register('check_lib', 'rsc.txt', alias='copied')
+    assert snapshot.has_resource('copied')
+    assert not man.has_resource('copied')
+
+    # Module level functions use the current global manager
+    with rsc.temp_manager(man):
+        assert rsc.get_resource('edit-cut') is edit_cut
+        assert rsc.has_resource('edit-cut')
+    assert rsc.get_resource('edit-cut', default=None) is not edit_cut
+
+
+def test_read_cache():
+    import resource_man as rsc
+
+    resource = rsc.Resource('check_lib', 'rsc.txt')
+    assert resource.package_dir == 'check_lib'
+    assert resource.ext_lower == '.txt'
+    assert rsc.Resource('fake', 'Image.PNG', data=b'').ext_lower == '.png'
+
+    # Changing the file does not return the old file's cached data
+    moved = rsc.Resource('check_lib', 'rsc.txt')
+    assert moved.read_bytes().strip() == b'rsc.txt'
+    assert str(moved).endswith('rsc.txt')
+    moved.package = 'check_lib.check_sub'
+    moved.name = 'rsc2.txt'
+    assert moved.read_bytes().strip() == b'rsc2.txt'
+    assert moved.read_text().strip() == 'rsc2.txt'
+    assert str(moved).endswith('rsc2.txt')
+    binary = resource.read_bytes()
+    assert resource.read_bytes() is binary
+    text = resource.read_text()
+    assert resource.read_text() is text
+
+    resource.invalidate()
+    assert resource.read_bytes() is not binary
+    assert resource.read_bytes() == binary
+
+    # Memory map the file without reading it into memory
+    mapped = resource.read_mmap()
+    assert bytes(mapped) == binary
+    assert resource.read_mmap() is mapped
+    resource.invalidate()
+    assert mapped.closed
+    mapped = resource.read_mmap()
+    assert bytes(mapped) == binary
+    assert rsc.Resource('fake_pkg', 'data.txt', data=b'data').read_mmap() == b'data'
+
+    # Decode errors raise ResourceNotAvailable like other read errors
+    image = rsc.Resource('check_lib.check_sub', 'edit-cut.png')
+    try:
+        image.read_text()
+        raise AssertionError('read_text should raise ResourceNotAvailable')
+    except rsc.ResourceNotAvailable:
+        pass
+    assert image.read_text(errors='replace')
+
+
+def test_file_path():
+    import os
+    import gc
+    import weakref
+    import resource_man as rsc
+
+    resource = rsc.Resource('check_lib', 'rsc.txt')
+    filename = str(resource)
+    assert os.path.exists(filename)
+    assert str(resource) is filename
+
+    # The as_file context exits when the resource is garbage collected
+    finalizer = resource._finalizer
+    ref = weakref.ref(resource)
+    del resource
+    gc.collect()
+    assert ref() is None
+    assert not finalizer.alive
+
+
+def test_preload():
+    import resource_man as rsc
+
+    man = rsc.ResourceManager()
+    text = man.register('check_lib', 'rsc.txt', ...)
+    edit_cut = man.register('check_lib.check_sub', 'edit-cut.png', None)
+    man.register_data(b'data', 'fake_pkg', 'data.txt', ...)
+
+    loaded = man.preload()
+    assert text in loaded
+    assert edit_cut in loaded
+    assert text._cache is not None
+    assert man.preload(['edit-cut', 'does-not-exist']) == [edit_cut]
+
+    # Files larger than MMAP_THRESHOLD are not kept in memory by read_bytes or read_text
+    import resource_man.interface as interface
+    old_threshold = interface.MMAP_THRESHOLD
+    interface.MMAP_THRESHOLD = 2
+    try:
+        text.invalidate()
+        assert man.preload([text]) == [text]
+        assert text._cache is None
+        assert text.read_text().strip() == 'rsc.txt'
+        assert not text._text_cache
+    finally:
+        interface.MMAP_THRESHOLD = old_threshold
+
+
+def test_mount():
+    import os
+    import tempfile
+    import resource_man as rsc
+
+    man = rsc.ResourceManager()
+    text = man.register('check_lib', 'rsc.txt', ...)
+    edit_cut = man.register('check_lib.check_sub', 'edit-cut.png', None)
+    expected_text = text.read_text()
+    expected_binary = edit_cut.read_bytes()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = rsc.create_rman(os.path.join(tmp, 'resources.rman'), resource_manager=man)
+
+        assert man.mount(filename)
+        try:
+            assert man.mounted.get(edit_cut.package_path) == expected_binary
+            text.invalidate()
+            edit_cut.invalidate()
+            assert text.read_text() == expected_text
+            assert edit_cut.read_bytes() == expected_binary
+        finally:
+            man.unmount()
+        assert man.mounted is None
+
+    assert not man.mount(os.path.join(tmp, 'does-not-exist.rman'))
+
+    # Resources of linked managers are read from the parent manager's mounted file
+    parent = rsc.ResourceManager()
+    parent.add_manager(man)
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = rsc.create_rman(os.path.join(tmp, 'resources.rman'), resource_manager=parent)
+        assert parent.mount(filename)
+        try:
+            assert man.mounted is None
+            edit_cut.invalidate()
+            assert edit_cut._read_mounted() == expected_binary
+            assert edit_cut.read_bytes() == expected_binary
+        finally:
+            parent.unmount()
+        assert edit_cut._read_mounted() is None
+
+
+def test_zip_cache():
+    import os
+    import sys
+    import zipfile
+    import tempfile
+    import resource_man as rsc
+    from resource_man import interface
+
+    old_dir = interface.ZIP_CACHE_DIR
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = os.path.join(tmp, 'zip_lib.zip')
+        with zipfile.ZipFile(archive, 'w') as z:
+            z.writestr('zip_pkg/__init__.py', '')
+            z.writestr('zip_pkg/data.txt', b'zip data')
+
+        interface.ZIP_CACHE_DIR = os.path.join(tmp, 'cache')
+        sys.path.insert(0, archive)
+        try:
+            # Only frozen executables use the cache
+            assert rsc.Resource('zip_pkg', 'data.txt').read_bytes() == b'zip data'
+            assert not os.path.exists(interface.ZIP_CACHE_DIR)
+
+            sys.frozen = True
+            resource = rsc.Resource('zip_pkg', 'data.txt')
+            assert resource.read_bytes() == b'zip data'
+            assert len(os.listdir(interface.ZIP_CACHE_DIR)) == 1
+            cache_file = os.path.join(interface.ZIP_CACHE_DIR, os.listdir(interface.ZIP_CACHE_DIR)[0])
+
+            # New resource reads from the cache file
+            with open(cache_file, 'wb') as f:
+                f.write(b'cached data')
+            assert rsc.Resource('zip_pkg', 'data.txt').read_bytes() == b'cached data'
+
+            if hasattr(os, 'getuid'):
+                # Cache directories that other users can access are not used
+                os.chmod(interface.ZIP_CACHE_DIR, 0o777)
+                assert rsc.Resource('zip_pkg', 'data.txt').read_bytes() == b'zip data'
+                os.chmod(interface.ZIP_CACHE_DIR, 0o700)
+
+            # A changed archive uses a new cache file
+            st = os.stat(archive)
+            os.utime(archive, ns=(st.st_atime_ns, st.st_mtime_ns - 10 ** 9))
+            assert rsc.Resource('zip_pkg', 'data.txt').read_bytes() == b'zip data'
+            assert len(os.listdir(interface.ZIP_CACHE_DIR)) == 2
+        finally:
+            vars(sys).pop('frozen', None)
+            sys.path.remove(archive)
+            sys.modules.pop('zip_pkg', None)
+            interface.ZIP_CACHE_DIR = old_dir
+            interface._zip_cache_key.cache_clear()
+            interface._files_cached.cache_clear()
+
+
 def test_register_directory():
     import resource_man as rsc
 
@@ -215,6 +462,12 @@ if __name__ == '__main__':
     test_contents()
     test_is_resource()
     test_register()
+    test_manager_lookup()
+    test_read_cache()
+    test_file_path()
+    test_preload()
+    test_mount()
+    test_zip_cache()
     test_register_directory()
     test_raw_filename()
 